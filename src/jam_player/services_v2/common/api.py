@@ -8,10 +8,12 @@ Includes request signing with Ed25519 keys.
 import hashlib
 import time
 import logging
+import threading
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from nacl.signing import SigningKey
 from nacl.encoding import Base64Encoder
 
@@ -33,6 +35,39 @@ API_URLS = {
 DEFAULT_ENVIRONMENT = 'prod'
 DEFAULT_REQUEST_TIMEOUT = 10  # seconds
 
+# Keep-alive connection pool for API calls. Periodic callers (heartbeat,
+# health monitor, content manager) reuse connections instead of paying a
+# TCP + TLS handshake per request.
+API_POOL_CONNECTIONS = 2   # Distinct hosts kept pooled (one per environment in practice)
+API_POOL_MAXSIZE = 4       # Connections per host (concurrent reporters)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_api_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for JAM API requests.
+
+    Created on first use; safe to call from multiple threads.
+
+    Returns:
+        The process-wide requests.Session.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=API_POOL_CONNECTIONS,
+                pool_maxsize=API_POOL_MAXSIZE
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
 
 def get_api_base_url() -> str:
     """
@@ -60,6 +95,33 @@ def get_api_base_url() -> str:
     return url
 
 
+# How much of an error response body to include in log messages
+RESPONSE_PREVIEW_LENGTH = 200
+
+
+def response_body_preview(response: requests.Response, limit: int = RESPONSE_PREVIEW_LENGTH) -> str:
+    """
+    Get the start of a response body for logging.
+
+    Decodes only the first `limit` bytes as UTF-8 instead of going through
+    response.text, which decodes the whole body (after charset detection).
+
+    Args:
+        response: The HTTP response
+        limit: Maximum number of bytes to include
+
+    Returns:
+        The body preview, or 'no response body' if the body is empty.
+    """
+    content = response.content
+    if not content:
+        return 'no response body'
+    preview = content[:limit].decode('utf-8', errors='replace')
+    if len(content) > limit:
+        preview += '...'
+    return preview
+
+
 def check_api_availability(timeout: int = DEFAULT_REQUEST_TIMEOUT) -> bool:
     """
     Check if the JAM 2.0 API is reachable.
@@ -78,7 +140,7 @@ def check_api_availability(timeout: int = DEFAULT_REQUEST_TIMEOUT) -> bool:
 
     try:
         logger.debug(f"Checking API availability: {health_url}")
-        response = requests.get(health_url, timeout=timeout)
+        response = get_api_session().get(health_url, timeout=timeout)
 
         if response.status_code == 200:
             logger.debug("JAM 2.0 API is available")
@@ -202,15 +264,16 @@ def api_request(
 
     try:
         logger.debug(f"Making API request: {method} {url}")
+        session = get_api_session()
 
         if method.upper() == 'GET':
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = session.get(url, headers=headers, timeout=timeout)
         elif method.upper() == 'POST':
-            response = requests.post(url, headers=headers, data=body_str, timeout=timeout)
+            response = session.post(url, headers=headers, data=body_str, timeout=timeout)
         elif method.upper() == 'PUT':
-            response = requests.put(url, headers=headers, data=body_str, timeout=timeout)
+            response = session.put(url, headers=headers, data=body_str, timeout=timeout)
         elif method.upper() == 'DELETE':
-            response = requests.delete(url, headers=headers, timeout=timeout)
+            response = session.delete(url, headers=headers, timeout=timeout)
         else:
             logger.error(f"Unsupported HTTP method: {method}")
             return None
@@ -411,10 +411,11 @@ def get_screen_id() -> Optional[str]:
         The screen ID string, or None if not linked/not found.
     """
     try:
-        if SCREEN_ID_FILE.exists():
-            screen_id = SCREEN_ID_FILE.read_text().strip()
-            if screen_id:
-                return screen_id
+        screen_id = SCREEN_ID_FILE.read_text().strip()
+        if screen_id:
+            return screen_id
+        return None
+    except FileNotFoundError:
         return None
     except PermissionError:
         logger.error(f"Permission denied reading {SCREEN_ID_FILE}")
@@ -0,0 +1,205 @@
+"""
+JAM Player 2.0 - Directory Change Notification
+
+Minimal inotify wrapper (via libc, no extra dependency) for services that
+react to flag/state files appearing or changing, so they can block until
+something happens instead of stat()ing the files on a timer.
+"""
+
+import os
+import time
+import struct
+import ctypes
+import select
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+
+# Files appearing, disappearing or finishing being written. Our writers use
+# write-to-temp + rename (IN_MOVED_TO). IN_MODIFY is left out on purpose: it
+# fires on every write() and would wake callers continuously during downloads.
+DIRECTORY_CHANGE_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# Always watched as well: the directory itself being renamed or removed.
+# A watch follows the inode, so after e.g. scenes_manager swaps in a new
+# live_scenes directory it would otherwise be watching the old copy.
+WATCH_LOST_MASK = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+
+# inotify_init1() flags (same values as O_NONBLOCK / O_CLOEXEC)
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+# Enough for a burst of events; we only care that *something* happened
+EVENT_BUFFER_SIZE = 4096
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class DirectoryWatcher:
+    """
+    Waits for changes to the entries of a set of directories.
+
+    Directories that don't exist (yet), or were renamed or removed, are
+    re-watched as soon as they (re)appear; until then has_all_watches is
+    False and the caller should fall back to polling.
+
+    Example:
+        watcher = DirectoryWatcher([DEVICE_DATA_DIR])
+        while running:
+            if watcher.wait(timeout_seconds=1):
+                recheck_state()
+    """
+
+    def __init__(self, directories: Iterable[Path], mask: int = DIRECTORY_CHANGE_MASK):
+        """
+        Start watching the given directories.
+
+        Args:
+            directories: Directories whose entries should be watched
+            mask: inotify event mask to watch for
+        """
+        self._fd: Optional[int] = None
+        self._libc = None
+        self._mask = mask | WATCH_LOST_MASK
+        self._directories: List[Path] = list(directories)
+        # Watch descriptor -> directory, for the directories watched now
+        self._watches: Dict[int, Path] = {}
+        self.watched: List[Path] = []
+        self.has_all_watches = False
+
+        try:
+            # The interpreter is already linked against libc
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify unavailable: {e}")
+            return
+
+        if fd < 0:
+            logger.warning(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+            return
+        self._fd = fd
+        self._libc = libc
+
+        self._add_missing_watches(log_failures=True)
+
+    def _add_missing_watches(self, log_failures: bool = False) -> bool:
+        """
+        Try to watch every directory that isn't watched yet.
+
+        Args:
+            log_failures: Log directories that can't be watched (only on
+                          the first attempt; retries happen on every wait)
+
+        Returns:
+            True if a watch was added.
+        """
+        added = False
+        for directory in self._directories:
+            if directory in self.watched:
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._mask)
+            if wd < 0:
+                if log_failures:
+                    logger.debug(f"Cannot watch {directory}: {os.strerror(ctypes.get_errno())}")
+                continue
+            self._watches[wd] = directory
+            added = True
+
+        if added:
+            logger.debug(f"Watching {len(self._watches)}/{len(self._directories)} directories")
+        self.watched = [d for d in self._directories if d in self._watches.values()]
+        self.has_all_watches = len(self.watched) == len(self._directories)
+        return added
+
+    def _drop_watch(self, wd: int) -> None:
+        """Forget a watch whose directory was renamed or removed."""
+        directory = self._watches.pop(wd, None)
+        if directory is None:
+            return
+        logger.debug(f"Lost watch on {directory}")
+        # A renamed directory stays watched under its new name; stop that
+        self._libc.inotify_rm_watch(self._fd, wd)
+        self.watched = [d for d in self.watched if d != directory]
+        self.has_all_watches = False
+
+    @property
+    def active(self) -> bool:
+        """True if inotify is available (directories may still be missing)."""
+        return self._fd is not None
+
+    def wait(self, timeout_seconds: float, wake_fds: Sequence[int] = ()) -> bool:
+        """
+        Block until a watched directory changes or the timeout expires.
+
+        Without inotify this just sleeps for the timeout. A directory that
+        starts being watched again counts as a change, since anything may
+        have happened in it while it wasn't.
+
+        Args:
+            timeout_seconds: Maximum time to wait
+            wake_fds: Other file descriptors that end the wait early when
+                      they become readable (e.g. a pidfd); reading them is
+                      up to the caller
+
+        Returns:
+            True if a change was seen, False on timeout or wake_fds.
+        """
+        if not self.active:
+            if wake_fds:
+                select.select(wake_fds, [], [], timeout_seconds)
+            else:
+                time.sleep(timeout_seconds)
+            return False
+
+        if not self.has_all_watches and self._add_missing_watches():
+            return True
+
+        readable, _, _ = select.select([self._fd, *wake_fds], [], [], timeout_seconds)
+        if self._fd not in readable:
+            return False
+
+        # Drain pending events; only lost watches need looking at
+        lost = False
+        try:
+            while True:
+                data = os.read(self._fd, EVENT_BUFFER_SIZE)
+                if not data:
+                    break
+                offset = 0
+                while offset + EVENT_HEADER.size <= len(data):
+                    wd, event_mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+                    offset += EVENT_HEADER.size + name_len
+                    if event_mask & WATCH_LOST_MASK:
+                        self._drop_watch(wd)
+                        lost = True
+        except BlockingIOError:
+            pass
+
+        if lost:
+            self._add_missing_watches()
+        return True
+
+    def close(self) -> None:
+        """Stop watching and release the inotify descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches.clear()
+            self.watched = []
+            self.has_all_watches = False
@@ -88,7 +88,10 @@ def wait_for_network(timeout_seconds: int = DEFAULT_NETWORK_WAIT_TIMEOUT) -> Tup
     """
     Wait for network connectivity with timeout.
 
-    Polls network state every 2 seconds until connected or timeout.
+    Event-driven: listens for NetworkManager's StateChanged D-Bus signal
+    and re-checks as soon as NM reports a connection, instead of sleeping
+    between polls. Falls back to polling every 2 seconds if D-Bus/GLib
+    isn't available.
 
     Args:
         timeout_seconds: Maximum time to wait for connectivity
@@ -98,6 +101,10 @@ def wait_for_network(timeout_seconds: int = DEFAULT_NETWORK_WAIT_TIMEOUT) -> Tup
     """
     logger.debug(f"Waiting up to {timeout_seconds}s for network connectivity...")
 
+    result = _wait_for_network_nm_signal(timeout_seconds)
+    if result is not None:
+        return result
+
     start_time = time.time()
     check_interval = 2  # seconds
 
@@ -114,6 +121,107 @@ def wait_for_network(timeout_seconds: int = DEFAULT_NETWORK_WAIT_TIMEOUT) -> Tup
     return False, "none"
 
 
+# NetworkManager D-Bus details (for wait_for_network)
+NM_SERVICE = 'org.freedesktop.NetworkManager'
+NM_PATH = '/org/freedesktop/NetworkManager'
+NM_INTERFACE = 'org.freedesktop.NetworkManager'
+NM_STATE_CONNECTED_LOCAL = 50
+
+# Safety-net re-check interval while waiting on NM signals, in case nmcli
+# lags the StateChanged signal that woke us
+NM_SIGNAL_WAIT_RECHECK_SECONDS = 5
+
+
+def _wait_for_network_nm_signal(timeout_seconds: int) -> Optional[Tuple[bool, str]]:
+    """
+    Wait for connectivity by reacting to NetworkManager StateChanged signals.
+
+    Runs a private GLib main context so it is safe to call from services
+    with or without their own main loop. Whenever NM reports a connected
+    state (>= CONNECTED_LOCAL) we confirm with check_nm_connection_state(),
+    which also tells us whether it's WiFi or Ethernet.
+
+    Args:
+        timeout_seconds: Maximum time to wait for connectivity
+
+    Returns:
+        Tuple of (is_connected, connection_type), or None if the system bus
+        can't be used (caller should fall back to polling).
+    """
+    try:
+        from gi.repository import GLib, Gio
+    except ImportError:
+        return None
+
+    start_time = time.time()
+    context = GLib.MainContext.new()
+    loop = GLib.MainLoop.new(context, False)
+    result = [False, "none"]
+
+    def check_now() -> bool:
+        connected, conn_type = check_nm_connection_state()
+        if connected:
+            result[0], result[1] = True, conn_type
+            loop.quit()
+        return connected
+
+    def on_state_changed(connection, sender_name, object_path, interface_name,
+                         signal_name, parameters):
+        state = parameters.unpack()[0]
+        if state >= NM_STATE_CONNECTED_LOCAL:
+            check_now()
+
+    def on_recheck() -> bool:
+        return not check_now()
+
+    def on_timeout() -> bool:
+        loop.quit()
+        return False
+
+    # Signal callbacks dispatch on the thread-default context at subscribe time
+    context.push_thread_default()
+    try:
+        try:
+            bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+        except GLib.Error as e:
+            logger.debug(f"System D-Bus unavailable, polling for network instead: {e}")
+            return None
+
+        subscription_id = bus.signal_subscribe(
+            NM_SERVICE,
+            NM_INTERFACE,
+            'StateChanged',
+            NM_PATH,
+            None,
+            Gio.DBusSignalFlags.NONE,
+            on_state_changed
+        )
+        try:
+            # Subscribed first so a transition between this check and the
+            # loop starting can't be missed
+            if not check_now():
+                recheck_source = GLib.timeout_source_new_seconds(NM_SIGNAL_WAIT_RECHECK_SECONDS)
+                recheck_source.set_callback(on_recheck)
+                recheck_source.attach(context)
+                timeout_source = GLib.timeout_source_new_seconds(timeout_seconds)
+                timeout_source.set_callback(on_timeout)
+                timeout_source.attach(context)
+                loop.run()
+                recheck_source.destroy()
+                timeout_source.destroy()
+        finally:
+            bus.signal_unsubscribe(subscription_id)
+    finally:
+        context.pop_thread_default()
+
+    if result[0]:
+        elapsed = time.time() - start_time
+        logger.debug(f"Network connected via {result[1]} after {elapsed:.1f}s")
+    else:
+        logger.debug(f"No network connectivity after {timeout_seconds}s")
+    return result[0], result[1]
+
+
 # Global cache for WiFi networks - used to avoid blocking BLE thread
 _wifi_networks_cache: List[Dict[str, str]] = []
 _wifi_scan_in_progress = False
@@ -34,6 +34,7 @@ Directory structure:
 
 import os
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Base directories
 JAM_ETC_DIR = Path('/etc/jam')
@@ -156,3 +157,51 @@ def safe_touch(path: Path, mode: int = 0o644):
         mode: File permissions (default 0o644)
     """
     safe_write_text(path, '', mode)
+
+
+def safe_write_bytes(path: Path, data: bytes, mode: int = 0o600,
+                     owner: Optional[Tuple[int, int]] = None):
+    """
+    Write bytes to a newly created file with the given mode, flushed to disk.
+
+    Unlike safe_write_text(), the file is created with its final mode
+    (O_CREAT|O_EXCL), so a private key is never briefly readable under the
+    default umask and no follow-up chmod is needed. Any existing file at
+    path is replaced.
+
+    Args:
+        path: Path to write to
+        data: Bytes to write
+        mode: File permissions (default 0o600)
+        owner: Optional (uid, gid) to chown the new file to (via the open fd)
+    """
+    path.unlink(missing_ok=True)
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        # Only chmod if a restrictive umask narrowed the creation mode
+        if os.fstat(fd).st_mode & 0o777 != mode:
+            os.fchmod(fd, mode)
+        if owner is not None:
+            os.fchown(fd, *owner)
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(path: Path):
+    """
+    Flush a directory's entries to disk.
+
+    fsync() on a file persists its contents, but the directory entry that
+    names a newly created file is only durable once the directory itself
+    is synced.
+
+    Args:
+        path: Directory to sync
+    """
+    fd = os.open(str(path), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -30,7 +30,7 @@ from common.credentials import (
     is_device_announced,
     set_device_announced,
 )
-from common.api import get_api_base_url, api_request
+from common.api import get_api_base_url, api_request, response_body_preview
 from common.paths import ANNOUNCED_FLAG
 from common.system import start_service
 
@@ -89,7 +89,7 @@ def announce_to_backend(
         logger.info("Device already announced/registered - treating as success")
         return True
     else:
-        logger.error(f"API returned status {response.status_code}: {response.text}")
+        logger.error(f"API returned status {response.status_code}: {response_body_preview(response)}")
         return False
 
 
@@ -55,16 +55,16 @@ This service runs continuously and must handle:
 """
 
 import sys
+import time
+import subprocess
 from pathlib import Path
 
 # Add services directory to path for common module imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-import dbus
-import dbus.mainloop.glib
-from gi.repository import GLib
+from gi.repository import GLib, Gio
 
-from common.system import manage_service
+from common.system import manage_service, check_service_active
 from common.network import InternetConnectivityMonitor, check_internet_connectivity
 from common.credentials import is_device_registered
 from common.paths import INTERNET_VERIFIED_FLAG, safe_touch
@@ -95,6 +95,9 @@ NM_PATH = '/org/freedesktop/NetworkManager'
 NM_INTERFACE = 'org.freedesktop.NetworkManager'
 DBUS_PROPS_INTERFACE = 'org.freedesktop.DBus.Properties'
 
+# Timeout (milliseconds) for synchronous calls to NetworkManager
+NM_CALL_TIMEOUT_MS = 5000
+
 # NetworkManager state values
 # We use NM state as a quick first check:
 #   - If NM says disconnected (<50), we're definitely offline
@@ -110,6 +113,18 @@ DBUS_PROPS_INTERFACE = 'org.freedesktop.DBus.Properties'
 # or CONNECTED_GLOBAL when it doesn't.
 NM_STATE_CONNECTED_LOCAL = 50
 
+# Human-readable NetworkManager state names (for logging)
+NM_STATE_NAMES = {
+    0: 'UNKNOWN',
+    10: 'ASLEEP',
+    20: 'DISCONNECTED',
+    30: 'DISCONNECTING',
+    40: 'CONNECTING',
+    50: 'CONNECTED_LOCAL',
+    60: 'CONNECTED_SITE',
+    70: 'CONNECTED_GLOBAL',
+}
+
 # Internet connectivity check settings
 # These are tuned for restaurant environments with flaky WiFi:
 # - 6 failures required before declaring offline
@@ -132,6 +147,9 @@ POST_CONNECTIVITY_SERVICES = [
     'jam-announce.service',
 ]
 
+# Delay (seconds) between successive POST_CONNECTIVITY_SERVICES restarts
+POST_CONNECTIVITY_RESTART_STAGGER = 2
+
 # Watchdog interval (seconds)
 WATCHDOG_INTERVAL = 30
 
@@ -162,13 +180,17 @@ class BLEStateManager:
         Initialize the state manager.
 
         Args:
-            bus: D-Bus system bus connection
+            bus: Gio.DBusConnection for the system bus
         """
         self.bus = bus
         self.mainloop = None
         self._pending_action = None  # GLib timeout ID for debounced action
         self._last_connected_state = None  # Track state to avoid redundant actions
         self._internet_check_timer = None  # GLib timeout for periodic checks
+        self._last_status = None  # Last STATUS= sent to systemd (dedup)
+        self._status_key = None  # Inputs that produced _last_status (steady-state path)
+        self._last_probe_time = 0.0  # time.monotonic() of last connectivity probe
+        self._ble_service_running = None  # Last BLE provisioning state we applied (None = unknown)
 
         # One-shot gate: trigger jam-update.service the first time a
         # never-registered device sees internet connectivity, so warehouse
@@ -187,14 +209,47 @@ class BLEStateManager:
             check_interval_seconds=INTERNET_CHECK_INTERVAL_SECONDS,
         )
 
-        # Get NetworkManager proxy
-        try:
-            self.nm_proxy = bus.get_object(NM_SERVICE, NM_PATH)
-            self.nm_props = dbus.Interface(self.nm_proxy, DBUS_PROPS_INTERFACE)
-            logger.info("Connected to NetworkManager D-Bus interface")
-        except dbus.exceptions.DBusException as e:
-            logger.error(f"Failed to connect to NetworkManager: {e}")
-            raise
+        # Unique bus name currently owning NM_SERVICE ('' while NM is gone,
+        # None until first observed) - see _on_nm_owner_changed()
+        self._nm_owner = None
+
+        # Gio signal subscription / name watch IDs (see setup_signal_handler)
+        self._nm_signal_id = None
+        self._nm_watch_id = None
+
+        # NetworkManager is addressed by its well-known name on every call
+        # and signal match, so GDBus routes to whichever process currently
+        # owns it - nothing goes stale across NetworkManager restarts.
+        logger.info("Connected to system D-Bus for NetworkManager monitoring")
+
+    def _set_status(self, status: str):
+        """
+        Update the systemd STATUS= line, skipping the notify if unchanged.
+
+        The periodic check re-reports the same status every interval while
+        the device is stable; there is no point writing it to the notify
+        socket again.
+
+        Args:
+            status: Human-readable status text (without the STATUS= prefix)
+        """
+        # Any explicit status update invalidates the steady-state cache
+        self._status_key = None
+        if status == self._last_status:
+            return
+        sd_notifier.notify(f"STATUS={status}")
+        self._last_status = status
+
+    def _check_connectivity(self) -> bool:
+        """
+        Run one hysteresis connectivity probe and record when it happened.
+
+        Returns:
+            Current online state from the connectivity monitor
+        """
+        is_online = self._connectivity_monitor.check()
+        self._last_probe_time = time.monotonic()
+        return is_online
 
     def _get_current_state(self) -> int:
         """
@@ -204,9 +259,20 @@ class BLEStateManager:
             NetworkManager state integer (0-70)
         """
         try:
-            state = self.nm_props.Get(NM_INTERFACE, 'State')
-            return int(state)
-        except dbus.exceptions.DBusException as e:
+            result = self.bus.call_sync(
+                NM_SERVICE,
+                NM_PATH,
+                DBUS_PROPS_INTERFACE,
+                'Get',
+                GLib.Variant('(ss)', (NM_INTERFACE, 'State')),
+                GLib.VariantType.new('(v)'),
+                Gio.DBusCallFlags.NONE,
+                NM_CALL_TIMEOUT_MS,
+                None
+            )
+            # unpack() recursively unwraps the (v) tuple to a plain int
+            return int(result.unpack()[0])
+        except GLib.Error as e:
             logger.error(f"Failed to get NetworkManager state: {e}")
             return 0  # Return unknown state on error
 
@@ -257,6 +323,13 @@ class BLEStateManager:
                 self._apply_offline_state
             )
         else:
+            if self._last_connected_state is True:
+                # Still connected (e.g. 60 -> 70) and internet already
+                # verified - nothing crossed the online/offline boundary.
+                # The periodic check will still catch a real outage.
+                logger.debug("Already verified online, skipping connectivity probe")
+                return
+
             # NM says connected - verify with actual connectivity test
             # The periodic check will handle this, but trigger one now
             logger.info("NetworkManager reports connected - verifying internet connectivity")
@@ -285,7 +358,7 @@ class BLEStateManager:
 
         self._last_connected_state = False
         self._apply_ble_state(is_online=False)
-        sd_notifier.notify("STATUS=Internet offline - BLE provisioning started")
+        self._set_status("Internet offline - BLE provisioning started")
 
         return False
 
@@ -315,9 +388,9 @@ class BLEStateManager:
 
         # Update systemd status
         if self._should_ble_run(is_online=True):
-            sd_notifier.notify("STATUS=Online but unregistered - BLE provisioning active")
+            self._set_status("Online but unregistered - BLE provisioning active")
         else:
-            sd_notifier.notify("STATUS=Online and registered - BLE provisioning stopped")
+            self._set_status("Online and registered - BLE provisioning stopped")
 
         return False
 
@@ -333,7 +406,7 @@ class BLEStateManager:
         """
         self._pending_action = None
 
-        is_online = self._connectivity_monitor.check()
+        is_online = self._check_connectivity()
 
         if self._connectivity_monitor.state_changed:
             if is_online:
@@ -345,23 +418,30 @@ class BLEStateManager:
                 )
                 self._last_connected_state = False
                 self._apply_ble_state(is_online=False)
-                sd_notifier.notify("STATUS=Internet offline - BLE provisioning started")
+                self._set_status("Internet offline - BLE provisioning started")
         else:
-            # State unchanged, just log current status
+            # State unchanged, just log current status. Only format the
+            # status text when its inputs changed since we last set it.
             if is_online:
                 method = self._connectivity_monitor.last_success_method
                 registered = is_device_registered()
-                if registered:
-                    sd_notifier.notify(f"STATUS=Online and registered (via {method})")
-                else:
-                    sd_notifier.notify(f"STATUS=Online but unregistered (via {method}) - BLE active")
+                status_key = (True, registered, method)
+                if status_key != self._status_key:
+                    if registered:
+                        self._set_status(f"Online and registered (via {method})")
+                    else:
+                        self._set_status(f"Online but unregistered (via {method}) - BLE active")
+                    self._status_key = status_key
             else:
                 failures = self._connectivity_monitor.consecutive_failures
-                remaining = INTERNET_CHECK_FAILURES_FOR_OFFLINE - failures
-                sd_notifier.notify(
-                    f"STATUS=Checking connectivity ({failures} failures, "
-                    f"{remaining} more before offline)"
-                )
+                status_key = (False, failures)
+                if status_key != self._status_key:
+                    remaining = INTERNET_CHECK_FAILURES_FOR_OFFLINE - failures
+                    self._set_status(
+                        f"Checking connectivity ({failures} failures, "
+                        f"{remaining} more before offline)"
+                    )
+                    self._status_key = status_key
 
         return False
 
@@ -382,9 +462,15 @@ class BLEStateManager:
         nm_state = self._get_current_state()
         if not self._nm_has_connection(nm_state):
             # NM says disconnected, skip the check
+            self._ensure_offline_ble_running()
             return True
 
-        is_online = self._connectivity_monitor.check()
+        # A debounced _verify_and_apply_state probe just ran (NM signal);
+        # another probe this soon would only repeat its answer
+        if time.monotonic() - self._last_probe_time < INTERNET_CHECK_INTERVAL_SECONDS / 2:
+            return True
+
+        is_online = self._check_connectivity()
 
         if self._connectivity_monitor.state_changed:
             if is_online:
@@ -396,30 +482,36 @@ class BLEStateManager:
                 )
                 self._last_connected_state = False
                 self._apply_ble_state(is_online=False)
-                sd_notifier.notify("STATUS=Internet offline - BLE provisioning started")
+                self._set_status("Internet offline - BLE provisioning started")
         elif is_online:
             # State didn't change, but check if registration status changed
             # This handles the case where device gets registered while online
             should_run = self._should_ble_run(is_online)
             if not should_run:
-                # Device is now registered - stop BLE if it's running
-                manage_service(BLE_PROVISIONING_SERVICE, should_run=False)
+                # Device is now registered - stop BLE if it's running.
+                # Always verify with systemd here (not the cache) so a BLE
+                # service restarted behind our back still gets stopped.
+                self._ble_service_running = None
+                self._set_ble_service(False)
+        else:
+            self._ensure_offline_ble_running()
 
         return True  # Keep the timeout repeating
 
+    def _ensure_offline_ble_running(self):
+        """
+        Make sure BLE provisioning is still running while we're offline.
+
+        Nothing else re-applies the BLE state until connectivity changes, so
+        if jam-ble-provisioning dies on its own (adapter power loss, restart
+        limit hit) the periodic check brings it back.
+        """
+        if self._last_connected_state is False:
+            self._set_ble_service(True)
+
     def _state_to_name(self, state: int) -> str:
         """Convert NetworkManager state integer to human-readable name."""
-        states = {
-            0: 'UNKNOWN',
-            10: 'ASLEEP',
-            20: 'DISCONNECTED',
-            30: 'DISCONNECTING',
-            40: 'CONNECTING',
-            50: 'CONNECTED_LOCAL',
-            60: 'CONNECTED_SITE',
-            70: 'CONNECTED_GLOBAL',
-        }
-        return states.get(state, f'UNKNOWN({state})')
+        return NM_STATE_NAMES.get(state, f'UNKNOWN({state})')
 
     def _on_properties_changed(self, interface, changed_props, invalidated_props):
         """
@@ -440,6 +532,17 @@ class BLEStateManager:
             state = int(changed_props['State'])
             self._on_state_changed(state)
 
+    def _on_properties_changed_signal(self, connection, sender_name, object_path,
+                                      interface_name, signal_name, parameters):
+        """
+        Gio signal_subscribe callback for NetworkManager PropertiesChanged.
+
+        Unpacks the (sa{sv}as) payload into plain Python values and hands
+        off to _on_properties_changed().
+        """
+        interface, changed_props, invalidated_props = parameters.unpack()
+        self._on_properties_changed(interface, changed_props, invalidated_props)
+
     def setup_signal_handler(self):
         """
         Register to receive NetworkManager state change signals.
@@ -448,15 +551,57 @@ class BLEStateManager:
         interface, which fires whenever any NetworkManager property changes.
         """
         # Subscribe to PropertiesChanged signal from NetworkManager
-        self.bus.add_signal_receiver(
-            self._on_properties_changed,
-            signal_name='PropertiesChanged',
-            dbus_interface=DBUS_PROPS_INTERFACE,
-            bus_name=NM_SERVICE,
-            path=NM_PATH
+        self._nm_signal_id = self.bus.signal_subscribe(
+            NM_SERVICE,
+            DBUS_PROPS_INTERFACE,
+            'PropertiesChanged',
+            NM_PATH,
+            NM_INTERFACE,  # arg0 match: only NetworkManager's own properties
+            Gio.DBusSignalFlags.NONE,
+            self._on_properties_changed_signal
         )
         logger.info("Subscribed to NetworkManager state change signals")
 
+        # Track NetworkManager restarts so we can re-sync state afterwards
+        self._nm_watch_id = Gio.bus_watch_name_on_connection(
+            self.bus,
+            NM_SERVICE,
+            Gio.BusNameWatcherFlags.NONE,
+            lambda connection, name, owner: self._on_nm_owner_changed(owner),
+            lambda connection, name: self._on_nm_owner_changed('')
+        )
+
+    def _on_nm_owner_changed(self, new_owner: str):
+        """
+        D-Bus callback for NameOwnerChanged on NM_SERVICE.
+
+        GDBus invokes this once on startup with the current owner, then on
+        every change. When NetworkManager restarts, any State
+        transitions that happened while it was away were never signalled,
+        so re-read the current State and feed it through the normal
+        state-change path.
+
+        The PropertiesChanged subscription is registered against the
+        well-known name, so GDBus re-targets it automatically; re-subscribing
+        here would only register a duplicate handler.
+
+        Args:
+            new_owner: Unique bus name of the new owner, or '' if NM exited
+        """
+        previous_owner = self._nm_owner
+        self._nm_owner = new_owner
+
+        if previous_owner is None or previous_owner == new_owner:
+            # Initial callback or no actual change
+            return
+
+        if not new_owner:
+            logger.warning("NetworkManager left the system bus")
+            return
+
+        logger.info("NetworkManager restarted - re-syncing state")
+        self._on_state_changed(self._get_current_state())
+
     def _should_ble_run(self, is_online: bool) -> bool:
         """
         Determine if BLE provisioning should be running.
@@ -488,29 +633,54 @@ class BLEStateManager:
 
         Called when connectivity is restored. These services need network
         access and may have exited or failed while the device was offline.
+
+        Restarts are staggered on the GLib main loop (one every
+        POST_CONNECTIVITY_RESTART_STAGGER seconds) rather than run back to
+        back, so D-Bus signals and watchdog pings are serviced in between
+        and systemd isn't hit with all four restarts at once.
         """
-        import subprocess
+        logger.info("Scheduling post-connectivity service restarts...")
 
-        logger.info("Restarting post-connectivity services...")
+        for i, service in enumerate(POST_CONNECTIVITY_SERVICES):
+            GLib.timeout_add_seconds(
+                i * POST_CONNECTIVITY_RESTART_STAGGER,
+                self._restart_post_connectivity_service,
+                service
+            )
 
-        for service in POST_CONNECTIVITY_SERVICES:
-            try:
-                result = subprocess.run(
-                    ['systemctl', 'restart', service],
-                    capture_output=True,
-                    text=True,
-                    timeout=15
-                )
-                if result.returncode == 0:
-                    logger.info(f"Restarted {service}")
-                else:
-                    # Not an error - service might not be needed yet
-                    # (e.g., jam-announce if already announced)
-                    logger.debug(f"Could not restart {service}: {result.stderr.strip()}")
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Timeout restarting {service}")
-            except Exception as e:
-                logger.warning(f"Error restarting {service}: {e}")
+    def _restart_post_connectivity_service(self, service: str) -> bool:
+        """
+        Restart a single post-connectivity service.
+
+        Uses --no-block so systemctl only enqueues the restart job and
+        returns immediately instead of holding the main loop until the
+        service finishes starting.
+
+        Args:
+            service: systemd unit name to restart
+
+        Returns:
+            False (to stop the GLib timeout from repeating)
+        """
+        try:
+            result = subprocess.run(
+                ['systemctl', 'restart', '--no-block', service],
+                capture_output=True,
+                text=True,
+                timeout=15
+            )
+            if result.returncode == 0:
+                logger.info(f"Queued restart of {service}")
+            else:
+                # Not an error - service might not be needed yet
+                # (e.g., jam-announce if already announced)
+                logger.debug(f"Could not queue restart of {service}: {result.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timeout restarting {service}")
+        except Exception as e:
+            logger.warning(f"Error restarting {service}: {e}")
+
+        return False
 
     def _maybe_trigger_first_connect_update(self):
         """
@@ -546,7 +716,6 @@ class BLEStateManager:
 
         self._first_connect_update_triggered = True
 
-        import subprocess
         logger.info(
             "First internet connection on an unregistered device -- "
             "triggering jam-update.service so warehouse devices catch "
@@ -622,7 +791,31 @@ class BLEStateManager:
 
             logger.info("Internet offline - starting BLE provisioning")
 
-        manage_service(BLE_PROVISIONING_SERVICE, should_run=should_run)
+        self._set_ble_service(should_run)
+
+    def _set_ble_service(self, should_run: bool):
+        """
+        Start or stop BLE provisioning, skipping the systemctl round-trips if
+        we already put it in that state.
+
+        During WiFi flaps the online/offline paths can both land here within
+        a few seconds with the same target; manage_service() costs several
+        systemctl invocations each time. The cache is only updated when
+        manage_service() succeeds so a failed start/stop is retried, and a
+        cached "running" is confirmed with one is-active query since the
+        service can die on its own.
+
+        Args:
+            should_run: True to ensure BLE provisioning is running
+        """
+        if self._ble_service_running == should_run:
+            if not should_run or check_service_active(BLE_PROVISIONING_SERVICE):
+                return
+            logger.warning(f"{BLE_PROVISIONING_SERVICE} is no longer running")
+        if manage_service(BLE_PROVISIONING_SERVICE, should_run=should_run):
+            self._ble_service_running = should_run
+        else:
+            self._ble_service_running = None
 
     def check_initial_state(self):
         """
@@ -667,7 +860,6 @@ class BLEStateManager:
                 logger.info("Initial connectivity check failed - performing additional checks...")
 
                 for i in range(2):  # 2 more checks = 3 total
-                    import time
                     time.sleep(2)
                     is_online, method = check_internet_connectivity()
                     if is_online:
@@ -730,13 +922,10 @@ def main():
     """Main entry point for the BLE state manager service."""
     log_service_start(logger, 'JAM BLE State Manager Service')
 
-    # Initialize D-Bus with GLib main loop
-    dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
-
-    # Connect to system bus
+    # Connect to system bus (GDBus dispatches on the default GLib main context)
     try:
-        bus = dbus.SystemBus()
-    except dbus.exceptions.DBusException as e:
+        bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+    except GLib.Error as e:
         logger.error(f"Failed to connect to system D-Bus: {e}")
         sys.exit(1)
 
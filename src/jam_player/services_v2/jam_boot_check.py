@@ -15,14 +15,17 @@ Checks performed:
 Note: Credential validation is NOT done here - we trust jam-first-boot.service.
 """
 
+import os
 import sys
+import time
+import logging
+import threading
+import concurrent.futures
 from pathlib import Path
 
 # Add services directory to path for common module imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-import sdnotify
-
 from common.logging_config import setup_service_logging, log_service_start
 from common.credentials import (
     get_device_uuid,
@@ -39,6 +42,7 @@ from common.system import (
     check_required_services,
     manage_service,
     clear_network_impairments,
+    get_systemd_notifier,
 )
 
 logger = setup_service_logging('jam-boot-check')
@@ -106,7 +110,17 @@ def ensure_system_dependencies() -> bool:
     return all_installed
 
 # systemd notify
-sd_notifier = sdnotify.SystemdNotifier()
+sd_notifier = get_systemd_notifier()
+
+# Boot check progress messages (sd_notify STATUS=)
+STATUS_STARTING = "STATUS=Running boot checks..."
+STATUS_CLEARING_IMPAIRMENTS = "STATUS=Clearing network impairments..."
+STATUS_CHECKING_NETWORK = "STATUS=Checking network connectivity..."
+STATUS_CHECKING_DEPENDENCIES = "STATUS=Checking system dependencies..."
+STATUS_MANAGING_BLE = "STATUS=Managing BLE provisioning..."
+STATUS_PROBING = "STATUS=Checking API, time sync and system services..."
+STATUS_COMPLETE = "STATUS=Boot check complete"
+STATUS_TIMED_OUT = "STATUS=Boot check timed out, continuing"
 
 # Service name constants
 BLE_PROVISIONING_SERVICE = 'jam-ble-provisioning.service'
@@ -114,6 +128,71 @@ BLE_PROVISIONING_SERVICE = 'jam-ble-provisioning.service'
 # Timeouts
 NETWORK_WAIT_TIMEOUT_SECONDS = 30
 
+# Overall budget (seconds) for the concurrent API / clock / services probes.
+# Each probe has its own shorter timeout; this only bounds the worst case.
+PROBE_TIMEOUT_SECONDS = 30
+
+# Hard deadline (seconds) for the whole boot check. The check is advisory,
+# so when it runs over we log, tell systemd and exit 0 rather than hold up
+# the services ordered after us. Time spent installing system dependencies
+# doesn't count: apt can legitimately take many minutes, is bounded by its
+# own timeouts and must not be abandoned mid-install. Override via the
+# environment variable (e.g. a drop-in with
+# Environment=JAM_BOOT_CHECK_DEADLINE_SECONDS=300).
+BOOT_CHECK_DEADLINE_ENV = 'JAM_BOOT_CHECK_DEADLINE_SECONDS'
+DEFAULT_BOOT_CHECK_DEADLINE_SECONDS = 180
+
+# Set while ensure_system_dependencies() runs, so main() can stop the
+# deadline clock for it
+_installing_dependencies = threading.Event()
+
+
+def get_boot_check_deadline() -> int:
+    """
+    Get the overall boot check deadline, honouring the environment override.
+
+    Returns:
+        Deadline in seconds (the default if the override is unset or invalid).
+    """
+    value = os.environ.get(BOOT_CHECK_DEADLINE_ENV)
+    if not value:
+        return DEFAULT_BOOT_CHECK_DEADLINE_SECONDS
+    try:
+        deadline = int(value)
+    except ValueError:
+        deadline = 0
+    if deadline <= 0:
+        logger.warning(
+            f"Invalid {BOOT_CHECK_DEADLINE_ENV}={value!r} - "
+            f"using {DEFAULT_BOOT_CHECK_DEADLINE_SECONDS}s"
+        )
+        return DEFAULT_BOOT_CHECK_DEADLINE_SECONDS
+    return deadline
+
+
+def _probe_result(future, name, default):
+    """
+    Collect a concurrent boot probe's result without letting it raise.
+
+    Args:
+        future: Future from the probe executor, or None if the probe was skipped
+        name: Probe name for logging
+        default: Value to return if the probe was skipped, failed or is unfinished
+
+    Returns:
+        The probe's return value, or default.
+    """
+    if future is None:
+        return default
+    if not future.done():
+        logger.warning(f"Boot probe '{name}' timed out")
+        return default
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning(f"Boot probe '{name}' failed: {e}")
+        return default
+
 
 def run_boot_check() -> bool:
     """
@@ -124,12 +203,12 @@ def run_boot_check() -> bool:
     log_service_start(logger, 'JAM Boot Check Service')
 
     # Notify systemd we're starting
-    sd_notifier.notify("STATUS=Running boot checks...")
+    sd_notifier.notify(STATUS_STARTING)
 
     # 0. Clear any network impairments left from testing
     # This ensures jam-simulate-network settings don't persist across reboots
     # or get baked into device images
-    sd_notifier.notify("STATUS=Clearing network impairments...")
+    sd_notifier.notify(STATUS_CLEARING_IMPAIRMENTS)
     clear_network_impairments()
 
     device_uuid = get_device_uuid()
@@ -139,19 +218,23 @@ def run_boot_check() -> bool:
         logger.warning("Device UUID not found")
 
     # 1. Wait briefly for network connectivity
-    sd_notifier.notify("STATUS=Checking network connectivity...")
+    sd_notifier.notify(STATUS_CHECKING_NETWORK)
     network_connected, conn_type = wait_for_network(timeout_seconds=NETWORK_WAIT_TIMEOUT_SECONDS)
 
     # 1b. Ensure system dependencies are installed (requires network)
     # This handles first-batch JAM 1.0 devices that migrated without MPV/Tailscale
     if network_connected:
-        sd_notifier.notify("STATUS=Checking system dependencies...")
-        deps_ok = ensure_system_dependencies()
+        sd_notifier.notify(STATUS_CHECKING_DEPENDENCIES)
+        _installing_dependencies.set()
+        try:
+            deps_ok = ensure_system_dependencies()
+        finally:
+            _installing_dependencies.clear()
         if not deps_ok:
             logger.warning("Some system dependencies could not be installed - will retry on next boot")
 
     # 2. Manage BLE provisioning service based on network state
-    sd_notifier.notify("STATUS=Managing BLE provisioning...")
+    sd_notifier.notify(STATUS_MANAGING_BLE)
 
     if not network_connected:
         # No network - start BLE for WiFi setup
@@ -162,32 +245,47 @@ def run_boot_check() -> bool:
         logger.info("Network connected - stopping BLE provisioning")
         manage_service(BLE_PROVISIONING_SERVICE, should_run=False)
 
-    # 3. Check API availability (non-blocking - offline playback must work)
-    if network_connected:
-        sd_notifier.notify("STATUS=Checking API availability...")
-        api_available = check_api_availability()
-        if not api_available:
-            logger.warning("JAM 2.0 API not available - device will operate in offline mode")
-    else:
+    # 3-5. API availability, chrony sync and required services are
+    # independent, so probe them concurrently: total latency is the
+    # slowest probe rather than the sum of all three.
+    sd_notifier.notify(STATUS_PROBING)
+    if not network_connected:
         logger.info("Skipping API check - no network connectivity")
-        api_available = False
 
-    # 4. Check chrony sync (non-blocking - for video wall sync)
-    sd_notifier.notify("STATUS=Checking time sync...")
-    clock_synced = check_chrony_sync()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+    try:
+        # API check is non-blocking - offline playback must work
+        f_api = executor.submit(check_api_availability) if network_connected else None
+        # Chrony sync is non-blocking - only affects video wall sync
+        f_clock = executor.submit(check_chrony_sync)
+        f_services = executor.submit(check_required_services)
+
+        futures = [f for f in (f_api, f_clock, f_services) if f is not None]
+        _, not_done = concurrent.futures.wait(futures, timeout=PROBE_TIMEOUT_SECONDS)
+        if not_done:
+            logger.warning(f"{len(not_done)} boot probe(s) did not finish within {PROBE_TIMEOUT_SECONDS}s")
+
+        api_available = _probe_result(f_api, "API availability", False)
+        clock_synced = _probe_result(f_clock, "chrony sync", False)
+        services_ok, failed_services = _probe_result(
+            f_services, "required services", (False, ['unknown'])
+        )
+    finally:
+        # Don't block on a stuck probe - each has its own timeout and
+        # will finish in the background
+        executor.shutdown(wait=False)
+
+    if network_connected and not api_available:
+        logger.warning("JAM 2.0 API not available - device will operate in offline mode")
     if not clock_synced:
         logger.warning("System clock not synchronized - video wall sync may be affected")
-
-    # 5. Check required system services
-    sd_notifier.notify("STATUS=Checking system services...")
-    services_ok, failed_services = check_required_services()
     if not services_ok:
         logger.warning(f"Some system services not running: {', '.join(failed_services)}")
 
     # Final summary
     logger.info("=" * 60)
     logger.info("JAM Boot Check Completed")
-    sd_notifier.notify("STATUS=Boot check complete")
+    sd_notifier.notify(STATUS_COMPLETE)
 
     logger.info(f"  Network: {'Connected via ' + conn_type if network_connected else 'Not connected'}")
     logger.info(f"  API: {'Available' if api_available else 'Not available'}")
@@ -198,15 +296,54 @@ def run_boot_check() -> bool:
     return True
 
 
-def main():
-    """Entry point for the service."""
+def _run_boot_check_safely() -> int:
+    """
+    Run the boot check, converting the outcome to a process exit code.
+
+    Returns:
+        0 if the boot check completed, 1 otherwise.
+    """
     try:
         success = run_boot_check()
-        sys.exit(0 if success else 1)
+        return 0 if success else 1
     except Exception as e:
         logger.exception(f"Unhandled exception in boot check service: {e}")
         sd_notifier.notify(f"STATUS=FAILED: {e}")
-        sys.exit(1)
+        return 1
+
+
+def main():
+    """Entry point for the service."""
+    deadline = get_boot_check_deadline()
+    exit_codes = []
+
+    # Run in a daemon thread so a stalled step (e.g. a hung apt-get or
+    # network probe) can be abandoned once the deadline passes
+    worker = threading.Thread(
+        target=lambda: exit_codes.append(_run_boot_check_safely()),
+        name='boot-check',
+        daemon=True
+    )
+    worker.start()
+
+    # Count down the deadline in one-second slices, skipping the slices
+    # spent installing dependencies
+    remaining = float(deadline)
+    while worker.is_alive() and remaining > 0:
+        slice_start = time.monotonic()
+        worker.join(min(1.0, remaining))
+        if not _installing_dependencies.is_set():
+            remaining -= time.monotonic() - slice_start
+
+    if worker.is_alive():
+        logger.warning(f"Boot check did not finish within {deadline}s - continuing boot")
+        sd_notifier.notify(STATUS_TIMED_OUT)
+        # Exit without waiting on the stuck worker (or the probe pool's
+        # threads, which the interpreter would otherwise join at exit)
+        logging.shutdown()
+        os._exit(0)
+
+    sys.exit(exit_codes[0] if exit_codes else 1)
 
 
 if __name__ == '__main__':
@@ -29,7 +29,8 @@ If a service fails:
 1. Log the failure
 2. Attempt to restart it
 3. Track failure count (per service)
-4. If > 3 failures in 5 minutes, stop trying to restart (avoid crash loop)
+4. If > 3 failures in 5 minutes, or 3 within a minute, stop trying to
+   restart (avoid crash loop)
 5. Report critical failure to backend API
 
 === Service Lifecycle ===
@@ -41,11 +42,16 @@ It must handle:
 - Network-aware API reporting (skip if offline)
 """
 
+import os
 import sys
 import time
+import signal
+import selectors
 import subprocess
+import concurrent.futures
 from pathlib import Path
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -54,13 +60,26 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from common.logging_config import setup_service_logging, log_service_start
 from common.system import (
-    get_service_status,
+    enable_systemd_signals,
+    get_service_states,
     get_systemd_notifier,
+    get_unit_object_path,
+    restart_service,
     setup_signal_handlers,
     WatchdogPinger,
+    SYSTEMD_SERVICE,
+    SYSTEMD_UNIT_INTERFACE,
 )
+from common.network import check_internet_connectivity
 from common.api import report_error, ErrorSeverity, SystemService, SYSTEMD_TO_SYSTEM_SERVICE
 
+# Try to import GLib/Gio for systemd unit signals (falls back to polling only)
+try:
+    from gi.repository import GLib, Gio
+    HAS_GLIB = True
+except ImportError:
+    HAS_GLIB = False
+
 # ============================================================================
 # Logging Configuration
 # ============================================================================
@@ -96,19 +115,41 @@ MONITORED_SERVICES = [
 # Note: jam-heartbeat is NOT in this list because it only runs when
 # the .registered flag exists.
 # We still monitor all these for failures but don't try to restart them directly.
-ALWAYS_RUNNING_SERVICES = [
+ALWAYS_RUNNING_SERVICES = frozenset({
     'jam-ble-state-manager.service',
     'jam-content-manager.service',
     'jam-player-display.service',
-]
+})
 
 # Failure thresholds
 MAX_FAILURES_IN_WINDOW = 3      # Stop restarting after this many failures
 FAILURE_WINDOW_MINUTES = 5      # Time window for counting failures
+RECENT_BURST_COUNT = 3          # ...or give up sooner after this many failures
+RECENT_BURST_SECONDS = 60       # within this many seconds (tight crash loop)
 
 # Check interval
 CHECK_INTERVAL_SECONDS = 30     # How often to check service status
 
+# Maximum time to wait for a service restart to complete
+RESTART_TIMEOUT_SECONDS = 60
+
+# Backend error report messages for service failures
+REPORT_UNMANAGED_FAILED = "Service {service} failed (status={status}) - managed by another service"
+REPORT_RESTARTED = "Service {service} failed (status={status}) and was restarted"
+REPORT_RESTART_FAILED = "Service {service} failed (status={status}) and restart failed"
+REPORT_GAVE_UP = (
+    "Service {service} failed {count} times in {minutes} minutes - restart attempts stopped"
+)
+REPORT_GAVE_UP_BURST = (
+    "Service {service} failed {count} times in {seconds} seconds (crash loop) "
+    "- restart attempts stopped"
+)
+
+# Backend error reports run in the background: report_error() retries for
+# up to ~2 minutes, longer than the watchdog allows the loop to stall
+REPORT_WORKERS = 4              # Concurrent backend reports
+REPORT_WAIT_SECONDS = 5         # How long a tick waits for its reports
+
 # Watchdog interval (seconds)
 WATCHDOG_INTERVAL = 30
 
@@ -120,19 +161,29 @@ BT_CHECK_INTERVAL_CYCLES = 2    # Check BT every 2 cycles (60 seconds)
 # Failure Tracking
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ServiceFailureTracker:
     """
     Tracks failures for a single service to detect crash loops.
 
     If a service fails more than MAX_FAILURES_IN_WINDOW times within
-    FAILURE_WINDOW_MINUTES, we stop trying to restart it to avoid
+    FAILURE_WINDOW_MINUTES, or RECENT_BURST_COUNT times within
+    RECENT_BURST_SECONDS, we stop trying to restart it to avoid
     a crash loop that wastes resources and fills logs.
     """
     service_name: str
-    failure_times: list = field(default_factory=list)
+    # time.monotonic() of each failure in the window, oldest first
+    failure_times: deque = field(default_factory=deque)
     gave_up: bool = False
-    gave_up_at: Optional[datetime] = None
+    gave_up_at: Optional[datetime] = None  # Wall-clock (UTC), for reporting only
+    # True if the RECENT_BURST_SECONDS rule (not the window) made us give up
+    gave_up_in_burst: bool = False
+
+    def _expire_old_failures(self, now: float):
+        """Drop failures that have fallen out of the window."""
+        cutoff = now - FAILURE_WINDOW_MINUTES * 60
+        while self.failure_times and self.failure_times[0] <= cutoff:
+            self.failure_times.popleft()
 
     def record_failure(self) -> bool:
         """
@@ -141,28 +192,35 @@ class ServiceFailureTracker:
         Returns:
             True if restart should be attempted, False if we've given up
         """
-        now = datetime.now()
+        # Monotonic so clock changes (NTP sync, timezone updates) can't
+        # stretch or shrink the window
+        now = time.monotonic()
 
         # Clear old failures outside the window
-        cutoff = now - timedelta(minutes=FAILURE_WINDOW_MINUTES)
-        self.failure_times = [t for t in self.failure_times if t > cutoff]
+        self._expire_old_failures(now)
 
         # Add this failure
         self.failure_times.append(now)
 
-        # Check if we've exceeded the threshold
-        if len(self.failure_times) > MAX_FAILURES_IN_WINDOW:
+        # Check if we've exceeded the threshold, or are failing again
+        # almost as soon as we restart
+        count = len(self.failure_times)
+        in_burst = (
+            count >= RECENT_BURST_COUNT
+            and now - self.failure_times[-RECENT_BURST_COUNT] <= RECENT_BURST_SECONDS
+        )
+        if count > MAX_FAILURES_IN_WINDOW or in_burst:
             self.gave_up = True
-            self.gave_up_at = now
+            self.gave_up_at = datetime.now(timezone.utc)
+            self.gave_up_in_burst = count <= MAX_FAILURES_IN_WINDOW
             return False
 
         return True
 
     def get_failure_count(self) -> int:
         """Get current failure count within the window."""
-        now = datetime.now()
-        cutoff = now - timedelta(minutes=FAILURE_WINDOW_MINUTES)
-        return len([t for t in self.failure_times if t > cutoff])
+        self._expire_old_failures(time.monotonic())
+        return len(self.failure_times)
 
 
 # ============================================================================
@@ -182,96 +240,237 @@ class HealthMonitor:
             for svc in MONITORED_SERVICES
         }
         self._check_cycle = 0  # Track cycles for periodic checks
+        self._report_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=REPORT_WORKERS,
+            thread_name_prefix='report'
+        )
+        self._pending_reports: list[concurrent.futures.Future] = []
+        # Internet connectivity for the current tick (None = not checked yet)
+        self._tick_has_internet: Optional[bool] = None
+        # GLib context systemd unit signals are dispatched on (None = polling only)
+        self._signal_context = None
+        # Monitored services systemd has reported as failed since the last check
+        self._failed_units: set[str] = set()
+        # Read end of the signal wakeup pipe (see _setup_signal_wakeup)
+        self._wakeup_fd: Optional[int] = None
+        self._wakeup_selector: Optional[selectors.BaseSelector] = None
+
+    def _setup_signal_wakeup(self):
+        """
+        Route signal arrival through a pipe the wait between checks watches.
+
+        Python only runs signal handlers once control returns from C, so a
+        blocking wait would hold off SIGTERM until the next check. With
+        signal.set_wakeup_fd() the C-level handler writes to the pipe,
+        ending the wait immediately. Must be called from the main thread.
+        """
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        signal.set_wakeup_fd(write_fd)
+        self._wakeup_fd = read_fd
+
+        self._wakeup_selector = selectors.DefaultSelector()
+        self._wakeup_selector.register(read_fd, selectors.EVENT_READ)
+
+    def _drain_signal_wakeup(self):
+        """Discard pending wakeup bytes (the signal handlers do the work)."""
+        try:
+            while os.read(self._wakeup_fd, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _watch_unit_failures(self) -> bool:
+        """
+        Subscribe to ActiveState changes of the monitored services.
+
+        Lets a crashed service be handled as soon as systemd marks it
+        failed, rather than at the next CHECK_INTERVAL_SECONDS check.
 
-    def _get_service_status(self, service: str) -> tuple[bool, str]:
+        Returns:
+            True if subscribed, False if D-Bus isn't available (polling only)
         """
-        Get the status of a systemd service.
+        if not HAS_GLIB:
+            return False
+
+        context = GLib.MainContext.new()
+        # Signal callbacks dispatch on the thread-default context at subscribe time
+        context.push_thread_default()
+        try:
+            bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            for service in MONITORED_SERVICES:
+                bus.signal_subscribe(
+                    SYSTEMD_SERVICE,
+                    'org.freedesktop.DBus.Properties',
+                    'PropertiesChanged',
+                    get_unit_object_path(service),
+                    SYSTEMD_UNIT_INTERFACE,
+                    Gio.DBusSignalFlags.NONE,
+                    self._on_unit_properties_changed,
+                    service
+                )
+            enable_systemd_signals(bus)
+
+            if self._wakeup_fd is not None:
+                # Signals must also wake the GLib wait between checks
+                wakeup_source = GLib.io_create_watch(
+                    GLib.IOChannel.unix_new(self._wakeup_fd), GLib.IOCondition.IN
+                )
+                wakeup_source.set_callback(self._on_signal_wakeup)
+                wakeup_source.attach(context)
+        except GLib.Error as e:
+            logger.warning(f"Cannot watch systemd for service failures, polling only: {e}")
+            return False
+        finally:
+            context.pop_thread_default()
+
+        self._signal_context = context
+        return True
+
+    def _on_unit_properties_changed(self, connection, sender_name, object_path,
+                                    interface_name, signal_name, parameters, service):
+        """Note a monitored service that systemd has just marked failed."""
+        _interface, changed, _invalidated = parameters.unpack()
+        # Only 'failed' wakes us early: 'inactive' is also seen briefly during
+        # deliberate restarts, so it is left to the regular check
+        if changed.get('ActiveState') == 'failed':
+            self._failed_units.add(service)
+
+    def _on_signal_wakeup(self, channel, condition) -> bool:
+        """GLib watch callback for the signal wakeup pipe."""
+        self._drain_signal_wakeup()
+        return True
+
+    def _wait_for_next_check(self, timeout_seconds: float):
+        """
+        Sleep until the next check is due, waking early if a service fails
+        or a shutdown signal arrives.
 
         Args:
-            service: Service name (e.g., 'jam-content-manager.service')
+            timeout_seconds: Time until the next regular check
+        """
+        if self._signal_context is None:
+            if self._wakeup_selector is None:
+                time.sleep(timeout_seconds)
+            elif self._wakeup_selector.select(timeout_seconds):
+                self._drain_signal_wakeup()
+            return
+
+        expired = [False]
+
+        def on_timeout() -> bool:
+            expired[0] = True
+            return False
+
+        timeout_source = GLib.timeout_source_new(int(timeout_seconds * 1000))
+        timeout_source.set_callback(on_timeout)
+        timeout_source.attach(self._signal_context)
+        try:
+            while self._running and not expired[0] and not self._failed_units:
+                self._signal_context.iteration(True)
+        finally:
+            timeout_source.destroy()
+
+    def _poll_states(self) -> dict[str, str]:
+        """
+        Get the state of every monitored service in one systemd query.
+
+        Callers take one snapshot per tick and pass it on, rather than
+        querying systemd once per service.
+
+        Note: reading /sys/fs/cgroup/system.slice/<unit>/cgroup.procs would
+        avoid even this one call, but a non-empty cgroup can't tell 'failed'
+        from 'inactive' (or 'activating'/'deactivating' from 'active'), and
+        that distinction is what decides whether we restart or report.
 
         Returns:
-            Tuple of (is_running, status_string)
+            Dict mapping each monitored service to its ActiveState
+            ('active', 'failed', ...), or 'error' if it couldn't be read.
         """
-        status = get_service_status(service)
-        if status is None:
-            return False, 'error'
-        is_running = (status == 'active')
-        return is_running, status
+        states = get_service_states(MONITORED_SERVICES)
+        return {
+            service: states[service][0] if service in states else 'error'
+            for service in MONITORED_SERVICES
+        }
 
     def _restart_service(self, service: str) -> bool:
         """
         Attempt to restart a systemd service.
 
+        Goes through systemd's D-Bus API (falling back to systemctl) and
+        waits for the restart job to finish.
+
         Args:
             service: Service name
 
         Returns:
-            True if restart command succeeded
+            True if the restart succeeded
         """
-        try:
-            logger.info(f"Attempting to restart {service}")
-            result = subprocess.run(
-                ['sudo', 'systemctl', 'restart', service],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            if result.returncode == 0:
-                logger.info(f"Successfully restarted {service}")
-                return True
-            else:
-                logger.error(f"Failed to restart {service}: {result.stderr}")
-                return False
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout restarting {service}")
-            return False
-        except Exception as e:
-            logger.error(f"Error restarting {service}: {e}")
-            return False
+        logger.info(f"Attempting to restart {service}")
+        return restart_service(service, timeout=RESTART_TIMEOUT_SECONDS)
+
+    def _has_internet(self) -> bool:
+        """
+        Check internet connectivity at most once per tick.
+
+        Only probed when there's something to report, and shared by every
+        report in the same tick.
+        """
+        if self._tick_has_internet is None:
+            self._tick_has_internet, _ = check_internet_connectivity()
+        return self._tick_has_internet
 
     def _report_to_backend(self, service: str, severity: ErrorSeverity, message: str):
         """
         Report an error to the backend API.
 
         This is best-effort - if we're offline or the API is down,
-        we just log locally and continue.
+        we just log locally and continue. The report is sent from a worker
+        thread so a slow backend can't hold up the monitor loop.
 
         Args:
             service: The systemd service name (e.g., 'jam-ble-provisioning.service')
             severity: Error severity level (use ErrorSeverity constants)
             message: Human-readable error message
         """
+        if not self._has_internet():
+            logger.debug(f"No internet connectivity, not reporting {service} failure to backend")
+            return
+
         # Map systemd service name to SystemService enum value
         system_service = SYSTEMD_TO_SYSTEM_SERVICE.get(service, SystemService.OTHER)
-        report_error(system_service, message, severity)
+        self._pending_reports.append(
+            self._report_executor.submit(report_error, system_service, message, severity)
+        )
 
-    def _should_attempt_restart(self, service: str) -> bool:
+    def _wait_for_reports(self):
         """
-        Check if we should attempt to restart a failed service.
-
-        Services in ALWAYS_RUNNING_SERVICES will be restarted when failed.
-        Services like jam-ble-provisioning are monitored for failure reporting
-        but NOT restarted, since their state is managed by another service.
-
-        Args:
-            service: Service name
+        Give this tick's backend reports a bounded time to finish.
 
-        Returns:
-            True if we should attempt to restart this service
+        Reports still running afterwards carry on in the background
+        (report_error logs its own outcome).
         """
-        return service in ALWAYS_RUNNING_SERVICES
+        if not self._pending_reports:
+            return
 
-    def _check_bluetooth_health(self):
+        _, not_done = concurrent.futures.wait(self._pending_reports, timeout=REPORT_WAIT_SECONDS)
+        if not_done:
+            logger.debug(f"{len(not_done)} backend report(s) still in progress")
+        self._pending_reports = []
+
+    def _check_bluetooth_health(self, states: dict[str, str]):
         """
         Check Bluetooth adapter health when BLE provisioning is running.
 
         If jam-ble-provisioning is active but the adapter is not discoverable,
         fix it by running bluetoothctl commands and restarting the service.
+
+        Args:
+            states: Service state snapshot from _poll_states()
         """
         # Only check if jam-ble-provisioning is running
-        is_running, status = self._get_service_status('jam-ble-provisioning.service')
-        if not is_running:
+        if states['jam-ble-provisioning.service'] != 'active':
             return
 
         # Check if adapter is discoverable
@@ -389,107 +588,182 @@ class HealthMonitor:
                 f'Failed to fix Bluetooth discoverable: {e}'
             )
 
-    def check_services(self):
+    def _handle_service(self, service: str, status: str):
         """
-        Check all monitored services and handle any failures.
+        Handle one monitored service given its current state.
 
         For services in ALWAYS_RUNNING_SERVICES: attempt restart on failure.
         For other services (like jam-ble-provisioning): log and report failures
         but don't attempt restart since they're managed by other services.
+
+        Args:
+            service: Service name
+            status: The service's ActiveState from _poll_states()
         """
-        for service in MONITORED_SERVICES:
-            tracker = self._trackers[service]
+        tracker = self._trackers[service]
 
-            # Skip if we've given up on this service
-            if tracker.gave_up:
-                continue
-
-            # Get current status
-            is_running, status = self._get_service_status(service)
-
-            # Check for failed status (not just inactive)
-            # "failed" means the service crashed, "inactive" could be intentional
-            is_failed = (status == 'failed')
-
-            if is_running:
-                # Service is healthy
-                continue
-
-            # For services we don't manage, only report if actually failed (crashed)
-            # "inactive" is expected for jam-ble-provisioning when online
-            if not self._should_attempt_restart(service):
-                if is_failed:
-                    # Service crashed - log and report, but don't restart
-                    logger.warning(f"Service {service} has failed (managed by another service)")
-                    tracker.record_failure()
-                    self._report_to_backend(
-                        service,
-                        ErrorSeverity.HIGH,
-                        f"Service {service} failed (status={status}) - managed by another service"
-                    )
-                continue
-
-            # Service should be running but isn't
-            logger.warning(f"Service {service} is {status}, should be running")
-
-            # Record the failure and check if we should restart
-            should_restart = tracker.record_failure()
-            failure_count = tracker.get_failure_count()
-
-            if should_restart:
-                # Attempt restart
-                logger.info(
-                    f"Attempting restart of {service} "
-                    f"(failure {failure_count}/{MAX_FAILURES_IN_WINDOW})"
-                )
+        # Skip if we've given up on this service
+        if tracker.gave_up:
+            return
 
-                restart_success = self._restart_service(service)
-
-                if restart_success:
-                    # Report as HIGH (failed but recovered)
-                    self._report_to_backend(
-                        service,
-                        ErrorSeverity.HIGH,
-                        f"Service {service} failed (status={status}) and was restarted"
-                    )
-                else:
-                    # Report restart failure
-                    self._report_to_backend(
-                        service,
-                        ErrorSeverity.HIGH,
-                        f"Service {service} failed (status={status}) and restart failed"
-                    )
-            else:
-                # We've exceeded the failure threshold - give up
-                logger.error(
-                    f"Service {service} has failed {failure_count} times "
-                    f"in {FAILURE_WINDOW_MINUTES} minutes - giving up on restarts"
-                )
+        is_running = (status == 'active')
+
+        # Check for failed status (not just inactive)
+        # "failed" means the service crashed, "inactive" could be intentional
+        is_failed = (status == 'failed')
+
+        if is_running:
+            # Service is healthy
+            return
 
-                # Report as SYSTEM_DOWN
+        # For services we don't manage, only report if actually failed (crashed)
+        # "inactive" is expected for jam-ble-provisioning when online
+        if service not in ALWAYS_RUNNING_SERVICES:
+            if is_failed:
+                # Service crashed - log and report, but don't restart
+                logger.warning(f"Service {service} has failed (managed by another service)")
+                tracker.record_failure()
                 self._report_to_backend(
                     service,
-                    ErrorSeverity.CRITICAL,
-                    f"Service {service} failed {failure_count} times in "
-                    f"{FAILURE_WINDOW_MINUTES} minutes - restart attempts stopped"
+                    ErrorSeverity.HIGH,
+                    REPORT_UNMANAGED_FAILED.format(service=service, status=status)
+                )
+            return
+
+        # Service should be running but isn't
+        logger.warning(f"Service {service} is {status}, should be running")
+
+        # Record the failure and check if we should restart
+        should_restart = tracker.record_failure()
+        failure_count = tracker.get_failure_count()
+
+        if should_restart:
+            # Attempt restart
+            logger.info(
+                f"Attempting restart of {service} "
+                f"(failure {failure_count}/{MAX_FAILURES_IN_WINDOW})"
+            )
+
+            restart_success = self._restart_service(service)
+
+            # Report as HIGH either way (failed but recovered, or restart failed)
+            template = REPORT_RESTARTED if restart_success else REPORT_RESTART_FAILED
+            self._report_to_backend(
+                service,
+                ErrorSeverity.HIGH,
+                template.format(service=service, status=status)
+            )
+        elif tracker.gave_up_in_burst:
+            # Failing again almost as soon as it restarts - give up
+            logger.error(
+                f"Service {service} has failed {RECENT_BURST_COUNT} times "
+                f"in {RECENT_BURST_SECONDS} seconds - crash loop, giving up on restarts"
+            )
+
+            # Report as SYSTEM_DOWN
+            self._report_to_backend(
+                service,
+                ErrorSeverity.CRITICAL,
+                REPORT_GAVE_UP_BURST.format(
+                    service=service, count=RECENT_BURST_COUNT, seconds=RECENT_BURST_SECONDS
+                )
+            )
+        else:
+            # We've exceeded the failure threshold - give up
+            logger.error(
+                f"Service {service} has failed {failure_count} times "
+                f"in {FAILURE_WINDOW_MINUTES} minutes - giving up on restarts"
+            )
+
+            # Report as SYSTEM_DOWN
+            self._report_to_backend(
+                service,
+                ErrorSeverity.CRITICAL,
+                REPORT_GAVE_UP.format(
+                    service=service, count=failure_count, minutes=FAILURE_WINDOW_MINUTES
                 )
+            )
+
+    def check_services(self, states: Optional[dict[str, str]] = None):
+        """
+        Check all monitored services and handle any failures.
+
+        Args:
+            states: Service state snapshot from _poll_states(); taken
+                    here if not provided
+        """
+        if states is None:
+            states = self._poll_states()
+
+        # A failed query says nothing about the services themselves - don't
+        # treat it as every service being down at once
+        if all(status == 'error' for status in states.values()):
+            logger.warning("Could not read service states from systemd - skipping check")
+            return
+
+        for service in MONITORED_SERVICES:
+            self._handle_service(service, states[service])
+
+    def get_status_summary(self, states: Optional[dict[str, str]] = None) -> str:
+        """
+        Get a summary of monitored service statuses.
+
+        Args:
+            states: Service state snapshot from _poll_states(); taken
+                    here if not provided
+        """
+        if states is None:
+            states = self._poll_states()
 
-    def get_status_summary(self) -> str:
-        """Get a summary of monitored service statuses."""
         statuses = []
         for service in MONITORED_SERVICES:
-            is_running, status = self._get_service_status(service)
+            status = states[service]
             tracker = self._trackers[service]
 
             if tracker.gave_up:
                 statuses.append(f"{service}: GAVE_UP")
-            elif is_running:
+            elif status == 'active':
                 statuses.append(f"{service}: OK")
             else:
                 statuses.append(f"{service}: {status}")
 
         return ", ".join(statuses)
 
+    def _run_full_check(self):
+        """Check every monitored service and publish the status summary."""
+        # This check covers any failures systemd has reported since the last
+        self._failed_units.clear()
+
+        # Snapshot all service states once for this tick
+        states = self._poll_states()
+
+        # Check all services
+        self.check_services(states)
+
+        # Periodically check Bluetooth health
+        self._check_cycle += 1
+        if self._check_cycle % BT_CHECK_INTERVAL_CYCLES == 0:
+            self._check_bluetooth_health(states)
+
+        # Bounded wait for any failure reports queued above
+        self._wait_for_reports()
+
+        # Update status (fresh snapshot so restarts above are reflected)
+        status_summary = self.get_status_summary()
+        sd_notifier.notify(f"STATUS={status_summary}")
+
+    def _handle_failed_units(self):
+        """Handle just the services systemd has reported as failed."""
+        failed_units, self._failed_units = self._failed_units, set()
+        logger.info(f"systemd reported failure of {', '.join(sorted(failed_units))}")
+
+        states = self._poll_states()
+        for service in MONITORED_SERVICES:
+            if service in failed_units:
+                self._handle_service(service, states[service])
+
+        self._wait_for_reports()
+
     def stop(self):
         """Signal the monitor to stop."""
         self._running = False
@@ -505,30 +779,35 @@ class HealthMonitor:
 
         watchdog = WatchdogPinger(WATCHDOG_INTERVAL)
 
+        # Shutdown signals and (if D-Bus allows) systemd failure notices
+        # both end the wait between checks early
+        self._setup_signal_wakeup()
+        self._watch_unit_failures()
+        next_check = time.monotonic()
+
         while self._running:
             try:
-                # Check all services
-                self.check_services()
-
-                # Periodically check Bluetooth health
-                self._check_cycle += 1
-                if self._check_cycle % BT_CHECK_INTERVAL_CYCLES == 0:
-                    self._check_bluetooth_health()
+                # Connectivity is re-checked (lazily) each tick
+                self._tick_has_internet = None
 
-                # Update status
-                status_summary = self.get_status_summary()
-                sd_notifier.notify(f"STATUS={status_summary}")
+                if time.monotonic() >= next_check:
+                    next_check = time.monotonic() + CHECK_INTERVAL_SECONDS
+                    self._run_full_check()
+                elif self._failed_units:
+                    self._handle_failed_units()
 
                 # Ping watchdog if due
                 watchdog.ping_if_due()
 
-                # Sleep until next check
-                time.sleep(CHECK_INTERVAL_SECONDS)
-
             except Exception as e:
                 logger.exception(f"Error in health monitor loop: {e}")
-                time.sleep(CHECK_INTERVAL_SECONDS)
+                next_check = time.monotonic() + CHECK_INTERVAL_SECONDS
+
+            # Sleep until next check (or until systemd reports a failure)
+            self._wait_for_next_check(max(0.0, next_check - time.monotonic()))
 
+        # Don't hold up shutdown for reports still retrying
+        self._report_executor.shutdown(wait=False, cancel_futures=True)
         logger.info("Health monitor stopped")
 
 
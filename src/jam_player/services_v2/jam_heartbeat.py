@@ -26,8 +26,8 @@ This means heartbeats start as soon as the device announces itself, not waiting
 
 import sys
 import os
-import time
 import signal
+import threading
 import subprocess
 
 # Add the services directory to path
@@ -44,6 +44,7 @@ from common.credentials import (
     get_location_timezone,
 )
 from common.api import api_request
+from common.system import set_timezone_timedated
 
 logger = setup_service_logging('jam-heartbeat')
 
@@ -58,18 +59,20 @@ FAILURE_LOG_THRESHOLD = 3
 INITIAL_RETRY_DELAY = 30
 MAX_RETRY_DELAY = HEARTBEAT_INTERVAL_SECONDS  # Cap at normal interval
 
+# Symlink timedatectl maintains to point at the active zoneinfo file
+LOCALTIME_PATH = '/etc/localtime'
+
 # Systemd notify
 notifier = sdnotify.SystemdNotifier()
 
-# Track if we should keep running
-running = True
+# Set when we should stop; waiting on it lets shutdown interrupt the sleep
+stop_event = threading.Event()
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    global running
     logger.info(f"Received signal {signum}, shutting down...")
-    running = False
+    stop_event.set()
 
 
 def send_heartbeat() -> tuple[bool, str | None, str | None, str | None]:
@@ -109,7 +112,7 @@ def send_heartbeat() -> tuple[bool, str | None, str | None, str | None]:
 
 def apply_system_timezone(timezone: str) -> bool:
     """
-    Apply a timezone to the system using timedatectl.
+    Apply a timezone to the system via systemd-timedated (timedatectl as fallback).
 
     Args:
         timezone: IANA timezone identifier (e.g., "America/New_York")
@@ -117,6 +120,21 @@ def apply_system_timezone(timezone: str) -> bool:
     Returns:
         True if timezone was applied successfully, False otherwise.
     """
+    # Skip timedatectl when the OS is already on this zone (e.g. the stored
+    # timezone re-applied after a reboot)
+    try:
+        if os.readlink(LOCALTIME_PATH).endswith(f'/zoneinfo/{timezone}'):
+            logger.debug(f"System timezone already {timezone}")
+            return True
+    except OSError:
+        pass  # Missing or not a symlink - let timedated sort it out
+
+    applied = set_timezone_timedated(timezone)
+    if applied is not None:
+        if applied:
+            logger.info(f"System timezone set to: {timezone}")
+        return applied
+
     try:
         result = subprocess.run(
             ['timedatectl', 'set-timezone', timezone],
@@ -142,8 +160,6 @@ def apply_system_timezone(timezone: str) -> bool:
 
 
 def main():
-    global running
-
     log_service_start(logger, 'JAM Heartbeat Service')
 
     # Register signal handlers
@@ -169,7 +185,7 @@ def main():
     consecutive_failures = 0
     current_retry_delay = INITIAL_RETRY_DELAY
 
-    while running:
+    while not stop_event.is_set():
         # Send heartbeat
         success, screen_id, location_timezone, display_orientation = send_heartbeat()
 
@@ -224,11 +240,9 @@ def main():
             wait_time = min(current_retry_delay, MAX_RETRY_DELAY)
             current_retry_delay = min(current_retry_delay * 2, MAX_RETRY_DELAY)
 
-        # Sleep in small increments so we can respond to signals
-        sleep_until = time.time() + wait_time
-        while running and time.time() < sleep_until:
-            remaining = sleep_until - time.time()
-            time.sleep(min(15, remaining) if remaining > 0 else 0)
+        # Wait for the next heartbeat, returning early on shutdown
+        if stop_event.wait(wait_time):
+            break
 
     logger.info("Heartbeat service shutting down")
     notifier.notify("STOPPING=1")
@@ -61,12 +61,15 @@ import sys
 import os
 import time
 import json
+import shutil
 import socket
 import subprocess
 import signal
 import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Any, List, Dict
 from dataclasses import dataclass
 from datetime import datetime, time as dt_time
@@ -82,8 +85,10 @@ from common.credentials import (
     get_device_uuid_short,
     get_display_orientation,
 )
-from common.system import get_systemd_notifier, setup_signal_handlers
+from common.system import get_systemd_notifier, setup_signal_handlers, WatchdogPinger
+from common.inotify import DirectoryWatcher
 from common.paths import (
+    DEVICE_DATA_DIR,
     SCREEN_ID_FILE,
     REGISTERED_FLAG,
     INTERNET_VERIFIED_FLAG,
@@ -112,22 +117,18 @@ logger = setup_service_logging('jam-player-display')
 def _log_dependency_status():
     """Log the availability of optional dependencies."""
     logger.info(f"Dependency status: PIL={HAS_PIL}, qrcode={HAS_QRCODE}")
+    if HAS_PIL:
+        # Screen render times depend on the Pillow build (a SIMD fork
+        # reports a .postN suffix)
+        logger.info(f"Pillow version: {Image.__version__}")
 
     # Check for feh
-    try:
-        result = subprocess.run(['which', 'feh'], capture_output=True, text=True)
-        has_feh = result.returncode == 0
-        logger.info(f"feh available: {has_feh} ({result.stdout.strip() if has_feh else 'not found'})")
-    except Exception as e:
-        logger.warning(f"Could not check for feh: {e}")
+    feh_path = shutil.which('feh')
+    logger.info(f"feh available: {feh_path is not None} ({feh_path or 'not found'})")
 
     # Check for ImageMagick (fallback)
-    try:
-        result = subprocess.run(['which', 'convert'], capture_output=True, text=True)
-        has_imagemagick = result.returncode == 0
-        logger.info(f"ImageMagick available: {has_imagemagick} ({result.stdout.strip() if has_imagemagick else 'not found'})")
-    except Exception as e:
-        logger.warning(f"Could not check for ImageMagick: {e}")
+    convert_path = shutil.which('convert')
+    logger.info(f"ImageMagick available: {convert_path is not None} ({convert_path or 'not found'})")
 sd_notifier = get_systemd_notifier()
 
 
@@ -217,70 +218,112 @@ def parse_time_str(time_str: str) -> Optional[dt_time]:
         return None
 
 
-def is_scene_scheduled_now(scene: Dict[str, Any]) -> bool:
+# Stand-in for a missing or unparseable start/end time in compiled schedules
+NO_TIME = -1
+
+# Compiled bounds of an entry with neither start nor end time: the whole day
+ALL_DAY_START_SEC = 0
+ALL_DAY_END_SEC = 24 * 60 * 60
+
+
+def compile_schedule(days_scheduled: Any) -> Optional[List[tuple]]:
     """
-    Check if a scene should be displayed right now based on its daysScheduled.
+    Precompute a scene's daysScheduled into integer comparisons.
 
-    Rules from the design doc:
-    1. If current day is NOT in daysScheduled list → don't display
-    2. If current day IS in list but startTime/endTime are null → display all day
-    3. If current day IS in list with startTime + endTime → only display during that range
+    Day names and 'HH:MM' strings only change when scenes.json does, so
+    they are resolved once at load time instead of on every schedule check.
 
     Args:
-        scene: Scene dict with optional 'days_scheduled' field
+        days_scheduled: The scene's 'days_scheduled' value
 
     Returns:
-        True if scene should be displayed now, False otherwise
+        None if the scene has no scheduling info (always displayed),
+        otherwise a list of (weekday_index, start_sec, end_sec) tuples in
+        the original order, with seconds since midnight or NO_TIME.
+        Entries for unknown days are dropped since they can never match.
     """
-    days_scheduled = scene.get('days_scheduled', [])
-
-    # If no scheduling info, always display (backwards compatibility)
     if not days_scheduled:
-        return True
-
-    now = datetime.now()
-    current_weekday = WEEKDAY_NAMES[now.weekday()]
-    current_time = now.time()
+        return None
 
-    # Find schedule entry for current day
+    compiled = []
     for schedule in days_scheduled:
+        if not isinstance(schedule, dict):
+            continue
         day_of_week = schedule.get('dayOfWeek')
         # Handle both formats: string "FRIDAY" or object {"value": "FRIDAY", "label": "Friday"}
         if isinstance(day_of_week, dict):
             day_of_week = day_of_week.get('value')
-        if day_of_week != current_weekday:
+        if day_of_week not in WEEKDAY_NAMES:
             continue
+        weekday_idx = WEEKDAY_NAMES.index(day_of_week)
 
-        # Found entry for today
         start_time_str = schedule.get('startTime')
         end_time_str = schedule.get('endTime')
 
         # If no time constraints, display all day
         if not start_time_str and not end_time_str:
-            return True
+            compiled.append((weekday_idx, ALL_DAY_START_SEC, ALL_DAY_END_SEC))
+            continue
 
-        # If we have time constraints, check them
+        # Unparseable times compile to NO_TIME, which (as before) means
+        # the entry never matches if both are bad
         start_time = parse_time_str(start_time_str)
         end_time = parse_time_str(end_time_str)
+        start_sec = start_time.hour * 3600 + start_time.minute * 60 if start_time else NO_TIME
+        end_sec = end_time.hour * 3600 + end_time.minute * 60 if end_time else NO_TIME
+        compiled.append((weekday_idx, start_sec, end_sec))
 
-        if start_time and end_time:
-            # Handle overnight schedules (e.g., 22:00 to 02:00)
-            if start_time <= end_time:
+    return compiled
+
+
+def is_scene_scheduled_now(scene: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+    """
+    Check if a scene should be displayed right now based on its daysScheduled.
+
+    Rules from the design doc:
+    1. If current day is NOT in daysScheduled list → don't display
+    2. If current day IS in list but startTime/endTime are null → display all day
+    3. If current day IS in list with startTime + endTime → only display during that range
+
+    Args:
+        scene: Scene dict with optional 'days_scheduled' field, and
+               optionally its precompiled '_schedule' (see compile_schedule)
+        now: Time to check against (defaults to the current local time)
+
+    Returns:
+        True if scene should be displayed now, False otherwise
+    """
+    if '_schedule' in scene:
+        schedule = scene['_schedule']
+    else:
+        schedule = compile_schedule(scene.get('days_scheduled', []))
+
+    # If no scheduling info, always display (backwards compatibility)
+    if schedule is None:
+        return True
+
+    if now is None:
+        now = datetime.now()
+    today_idx = now.weekday()
+    current_sec = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1_000_000
+
+    # The first entry for the current day decides
+    for weekday_idx, start_sec, end_sec in schedule:
+        if weekday_idx != today_idx:
+            continue
+
+        if start_sec != NO_TIME and end_sec != NO_TIME:
+            if start_sec <= end_sec:
                 # Normal range (e.g., 09:00 to 17:00)
-                if start_time <= current_time <= end_time:
-                    return True
-            else:
-                # Overnight range (e.g., 22:00 to 02:00)
-                if current_time >= start_time or current_time <= end_time:
-                    return True
-        elif start_time:
+                return start_sec <= current_sec <= end_sec
+            # Overnight range (e.g., 22:00 to 02:00)
+            return current_sec >= start_sec or current_sec <= end_sec
+        if start_sec != NO_TIME:
             # Only start time - display from start time until midnight
-            if current_time >= start_time:
-                return True
-        elif end_time:
+            return current_sec >= start_sec
+        if end_sec != NO_TIME:
             # Only end time - display from midnight until end time
-            if current_time <= end_time:
-                return True
+            return current_sec <= end_sec
 
         # Time constraints not met
         return False
@@ -299,7 +342,9 @@ def filter_scenes_by_schedule(scenes: List[Dict[str, Any]]) -> List[Dict[str, An
     Returns:
         Filtered list of scenes that are scheduled for now
     """
-    filtered = [s for s in scenes if is_scene_scheduled_now(s)]
+    # One clock read for the whole list, so every scene is judged at the same instant
+    now = datetime.now()
+    filtered = [s for s in scenes if is_scene_scheduled_now(s, now)]
     if len(filtered) != len(scenes):
         logger.info(f"Schedule filter: {len(filtered)}/{len(scenes)} scenes active now")
     return filtered
@@ -336,8 +381,36 @@ JAM_LOGO_PATH = "/root/jam_logo.png"
 # URLs for setup
 UNIVERSAL_SETUP_URL = "https://setup.justamenu.com"
 
+# Rendered screens are written to RAM (tmpfs), not the SD card
+DISPLAY_IMAGE_DIR = "/dev/shm"
+# Fast zlib setting: the PNG only lives until the next screen change
+DISPLAY_PNG_COMPRESS_LEVEL = 1
+
+# Longest a transition waits for a static screen render (possibly queued
+# behind a pre-render already in progress) before using the ImageMagick
+# fallback instead
+SCREEN_RENDER_WAIT_TIMEOUT_SEC = 30
+
+# X server for DISPLAY=:0 and how long to wait for it before giving up
+X11_SOCKET_PATH = "/tmp/.X11-unix/X0"
+DISPLAY_WAIT_TIMEOUT_SEC = 30
+# Probing the socket is a single connect(); xdpyinfo is a sudo + exec
+DISPLAY_SOCKET_POLL_SEC = 0.1
+DISPLAY_XDPYINFO_POLL_SEC = 1
+
+# How often the systemd watchdog is pinged (WatchdogSec=60). Loops call
+# ping_if_due() on every pass; this only rate-limits the notify messages,
+# so a stuck loop still stops the pings.
+WATCHDOG_PING_INTERVAL_SEC = 5
+
 # State checking intervals
 STATE_CHECK_INTERVAL_SEC = 5
+# When every state directory is watched via inotify, changes trigger an
+# immediate re-check and the periodic check is only a safety net
+STATE_CHECK_WATCHED_INTERVAL_SEC = 60
+# Minimum gap between feh restarts in static modes, so a feh that dies
+# straight away (X auth, bad image) isn't relaunched in a tight loop
+FEH_RESTART_MIN_INTERVAL_SEC = 1
 
 
 # =============================================================================
@@ -354,30 +427,86 @@ def get_fb_size() -> tuple:
         return 1920, 1080
 
 
+# Font candidates in order of preference
+BOLD_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+]
+REGULAR_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+]
+
+# Resolved once at import; fonts are installed with the image, not at runtime
+_RESOLVED_BOLD_FONT_PATH = next((p for p in BOLD_FONT_PATHS if os.path.exists(p)), None)
+_RESOLVED_REGULAR_FONT_PATH = next((p for p in REGULAR_FONT_PATHS if os.path.exists(p)), None)
+
+
+@lru_cache(maxsize=32)
 def get_font(size: int, bold: bool = True):
-    """Get a font, falling back to default if needed."""
+    """
+    Get a font, falling back to default if needed.
+
+    Cached per (size, bold) so each screen render reuses the parsed face
+    instead of re-reading the TTF. Callers only pass fonts to ImageDraw,
+    which doesn't mutate them, so sharing is safe.
+    """
     if not HAS_PIL:
         return None
 
-    if bold:
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        ]
-    else:
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-        ]
-    for path in font_paths:
-        if os.path.exists(path):
-            return ImageFont.truetype(path, size)
+    path = _RESOLVED_BOLD_FONT_PATH if bold else _RESOLVED_REGULAR_FONT_PATH
+    if path:
+        return ImageFont.truetype(path, size)
     return ImageFont.load_default()
 
 
+def get_line_height(font) -> int:
+    """
+    Get the vertical advance for one line of text in the given font.
+
+    Uses the font's fixed metrics rather than measuring each string, so
+    laying out a line costs no extra text shaping.
+    """
+    try:
+        ascent, descent = font.getmetrics()
+    except AttributeError:
+        # Bitmap default font on older Pillow has no metrics
+        return font.getbbox("Ag")[3]
+    return ascent + descent
+
+
+@dataclass(frozen=True)
+class TextLine:
+    """One horizontally centred line of text in a screen layout."""
+    text: str
+    font: Any
+    color: tuple
+    # Extra space below the line, on top of the font's line height
+    gap_after: int = 0
+
+
+def draw_text_stack(draw, center_x: int, y: int, lines: List[TextLine]) -> int:
+    """
+    Draw lines of text centred on center_x, top to bottom from y.
+
+    Args:
+        draw: ImageDraw to draw with
+        center_x: Horizontal centre of every line
+        y: Top of the first line
+        lines: Lines to draw, in order
+
+    Returns:
+        The y coordinate below the last line (including its gap_after).
+    """
+    for line in lines:
+        draw.text((center_x, y), line.text, font=line.font, fill=line.color, anchor="mt")
+        y += get_line_height(line.font) + line.gap_after
+    return y
+
+
 def create_mesh_gradient_background(width: int, height: int, theme: str = "vibrant") -> Image.Image:
     """
     Create a vibrant mesh gradient background with multiple color points.
@@ -393,10 +522,6 @@ def create_mesh_gradient_background(width: int, height: int, theme: str = "vibra
     Returns:
         PIL Image with mesh gradient background
     """
-    import math
-
-    img = Image.new('RGB', (width, height))
-
     # Define color anchor points for each theme
     # Each point is (x_ratio, y_ratio, (r, g, b))
     themes = {
@@ -442,61 +567,66 @@ def create_mesh_gradient_background(width: int, height: int, theme: str = "vibra
 
     color_points = themes.get(theme, themes["vibrant"])
 
-    # Process in chunks for speed (every 2 pixels, then interpolate)
+    # Sample every 2nd pixel, then scale the samples up to full size
     step = 2
-    pixels = []
+    sample_w = (width + step - 1) // step
+    sample_h = (height + step - 1) // step
+
+    # Inverse distance weighting only needs squared distances, and those
+    # split into a per-column and a per-row term for each anchor point, so
+    # precompute both instead of redoing the math for every sample
+    dx2 = [[(x * step / width - px) ** 2 for x in range(sample_w)] for px, _, _ in color_points]
+    dy2 = [[(y * step / height - py) ** 2 for y in range(sample_h)] for _, py, _ in color_points]
+    # Per column: the dx^2 term of every anchor point, in anchor order
+    column_dx2 = list(zip(*dx2))
+    colors = [color for _, _, color in color_points]
 
-    for y in range(0, height, step):
-        row = []
-        for x in range(0, width, step):
-            # Normalize coordinates
-            nx = x / width
-            ny = y / height
-
-            # Calculate weighted color based on distance to each anchor point
+    pixels = []
+    for yi in range(sample_h):
+        row_dy2 = [dy2[k][yi] for k in range(len(color_points))]
+        for point_dx2 in column_dx2:
             total_weight = 0.0
             r_sum, g_sum, b_sum = 0.0, 0.0, 0.0
 
-            for px, py, color in color_points:
-                # Distance from this pixel to the color point
-                dx = nx - px
-                dy = ny - py
-                dist = math.sqrt(dx * dx + dy * dy)
-
+            for ddx, ddy, color in zip(point_dx2, row_dy2, colors):
                 # Inverse distance weighting with falloff
                 # Add small epsilon to avoid division by zero
-                weight = 1.0 / (dist * dist * 4 + 0.01)
-
+                weight = 1.0 / ((ddx + ddy) * 4 + 0.01)
                 r_sum += color[0] * weight
                 g_sum += color[1] * weight
                 b_sum += color[2] * weight
                 total_weight += weight
 
             # Normalize
-            r = int(min(255, max(0, r_sum / total_weight)))
-            g = int(min(255, max(0, g_sum / total_weight)))
-            b = int(min(255, max(0, b_sum / total_weight)))
+            pixels.append((
+                int(min(255, max(0, r_sum / total_weight))),
+                int(min(255, max(0, g_sum / total_weight))),
+                int(min(255, max(0, b_sum / total_weight))),
+            ))
+
+    # Each sample fills a step x step block; a nearest-neighbour resize
+    # does that in one pass in C
+    samples = Image.new('RGB', (sample_w, sample_h))
+    samples.putdata(pixels)
+    img = samples.resize((sample_w * step, sample_h * step), Image.Resampling.NEAREST)
+    if img.size != (width, height):
+        img = img.crop((0, 0, width, height))
 
-            row.append((r, g, b))
+    return img
 
-        pixels.append(row)
 
-    # Draw the gradient
-    draw = ImageDraw.Draw(img)
-    for yi, row in enumerate(pixels):
-        y = yi * step
-        for xi, color in enumerate(row):
-            x = xi * step
-            # Draw a small rectangle for each sampled point
-            draw.rectangle([x, y, x + step, y + step], fill=color)
-
-    return img
+# Scaled logos keyed by target height. Every screen uses the same one or
+# two heights, so this saves re-reading and resampling the PNG per screen.
+_logo_cache: Dict[int, "Image.Image"] = {}
 
 
 def load_and_scale_logo(target_height: int) -> Optional[Image.Image]:
     """
     Load the JAM logo and scale it to the target height while maintaining aspect ratio.
 
+    Results are cached per height and shared, so callers must not modify
+    the returned image (pasting it is fine).
+
     Args:
         target_height: Desired height in pixels
 
@@ -506,6 +636,10 @@ def load_and_scale_logo(target_height: int) -> Optional[Image.Image]:
     if not HAS_PIL:
         return None
 
+    cached = _logo_cache.get(target_height)
+    if cached is not None:
+        return cached
+
     if not os.path.exists(JAM_LOGO_PATH):
         logger.warning(f"Logo not found at {JAM_LOGO_PATH}")
         return None
@@ -522,55 +656,148 @@ def load_and_scale_logo(target_height: int) -> Optional[Image.Image]:
         new_width = int(target_height * aspect)
 
         logo = logo.resize((new_width, target_height), Image.Resampling.LANCZOS)
+        _logo_cache[target_height] = logo
         return logo
     except Exception as e:
         logger.error(f"Failed to load logo: {e}")
         return None
 
 
+# QR mask pattern for UNIVERSAL_SETUP_URL: the one qrcode's penalty
+# scoring picks for it anyway. Passing it skips scoring all 8 masks.
+# Any mask scans; this just keeps the code identical to the automatic one.
+SETUP_URL_QR_MASK_PATTERN = 4
+
+# Rendered QR codes keyed by (url, size). The setup URL is constant and the
+# size only depends on the screen height, so this stays tiny.
+_qr_cache: Dict[tuple, "Image.Image"] = {}
+
+
 def generate_qr_code(url: str, size: int = 300) -> Optional[Image.Image]:
-    """Generate a QR code image for the given URL."""
+    """
+    Generate a QR code image for the given URL.
+
+    Results are cached per (url, size); callers get a copy so they can't
+    modify the cached image.
+    """
     if not HAS_PIL:
         return None
 
+    cached = _qr_cache.get((url, size))
+    if cached is not None:
+        return cached.copy()
+
     if not HAS_QRCODE:
         # Return a placeholder if qrcode module not available
-        img = Image.new('RGB', (size, size), (255, 255, 255))
+        img = Image.new('L', (size, size), 255)
         draw = ImageDraw.Draw(img)
-        draw.rectangle([0, 0, size-1, size-1], outline=(0, 0, 0), width=2)
-        draw.text((size//4, size//2), "QR Code", fill=(0, 0, 0))
+        draw.rectangle([0, 0, size-1, size-1], outline=0, width=2)
+        draw.text((size//4, size//2), "QR Code", fill=0)
         return img
 
+    border = 2
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=2,
+        border=border,
+        mask_pattern=SETUP_URL_QR_MASK_PATTERN if url == UNIVERSAL_SETUP_URL else None,
     )
     qr.add_data(url)
     qr.make(fit=True)
 
-    qr_img = qr.make_image(fill_color="black", back_color="white")
-    qr_img = qr_img.resize((size, size), Image.Resampling.NEAREST)
+    # Pick the module size that fits, so the QR code is drawn at its final
+    # resolution instead of being drawn at 10px/module and resized
+    modules = qr.modules_count + 2 * border
+    qr.box_size = max(1, size // modules)
+    qr_img = qr.make_image(fill_color="black", back_color="white").get_image()
+    # Black on white is 1-bit already; keep it that way so the cached copy
+    # is 1/24th the size of RGB. paste() converts into the RGB screen.
+    if qr_img.mode != '1':
+        qr_img = qr_img.convert('1')
 
-    return qr_img
+    # Pad the leftover (< one module) with quiet zone to get exactly size x size
+    if qr_img.size != (size, size):
+        padded = Image.new(qr_img.mode, (size, size), "white")
+        offset = (size - qr_img.width) // 2
+        padded.paste(qr_img, (offset, offset))
+        qr_img = padded
 
+    _qr_cache[(url, size)] = qr_img
+    return qr_img.copy()
 
-def create_unregistered_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
+
+# One cached base per setup screen builder (the STATIC_SCREENS entries)
+SCREEN_BASE_CACHE_SIZE = 5
+
+
+@lru_cache(maxsize=SCREEN_BASE_CACHE_SIZE)
+def _get_screen_base(build, width: int, height: int) -> Image.Image:
     """
-    Create the setup screen for AWAITING_NETWORK mode.
+    Build (or reuse) the static part of a setup screen.
 
-    Modern gradient design with:
-    - JAM Player logo
-    - "JAM Player" title
-    - Setup instructions
-    - QR code
-    - "Get ready to JAM." tagline
+    The gradient is by far the most expensive part of a render. A base is
+    kept for every screen, so pre-rendering the others doesn't evict the
+    one on display, and it is redrawn cheaply once the device UUID becomes
+    known. Callers must copy the result before drawing on it.
     """
-    if not HAS_PIL:
-        logger.error("PIL not available for creating display images")
-        return None
+    return build(width, height)
 
+
+# Canvas the finished setup screen is composed into, reused between renders
+_screen_canvas: Optional["Image.Image"] = None
+
+
+def _compose_screen(build, width: int, height: int, device_uuid: Optional[str]) -> Image.Image:
+    """
+    Compose a setup screen: its cached base plus the device footer.
+
+    The result is drawn into a canvas that is reused between calls rather
+    than a fresh full-screen image each time, so it is only valid until the
+    next setup screen is created. Callers save it straight away.
+    """
+    global _screen_canvas
+
+    base = _get_screen_base(build, width, height)
+    if _screen_canvas is None or _screen_canvas.size != base.size:
+        _screen_canvas = base.copy()
+    else:
+        _screen_canvas.paste(base)
+    _draw_screen_footer(_screen_canvas, device_uuid)
+    return _screen_canvas
+
+
+def _draw_screen_footer(img: Image.Image, device_uuid: Optional[str]) -> None:
+    """
+    Draw the device UUID and version marker along the bottom of a screen.
+
+    Every non-content screen shows the device UUID so support can identify
+    the physical JAM Player regardless of setup state.
+    """
+    width, height = img.size
+    draw = ImageDraw.Draw(img)
+
+    if device_uuid:
+        device_text = f"Device: {device_uuid}"
+        draw.text(
+            (width // 2, height - 50),
+            device_text,
+            font=get_font(FONT_SIZE_DEVICE_ID, bold=False),
+            fill=TEXT_COLOR,
+            anchor="mm"
+        )
+
+    # Version indicator in bottom-right corner
+    draw.text(
+        (width - 30, height - 25),
+        "v2",
+        font=get_font(14, bold=False),
+        fill=(80, 80, 80),  # Very subtle
+        anchor="mm"
+    )
+
+
+def _build_unregistered_base(width: int, height: int) -> Image.Image:
+    """Build the unregistered screen without the device footer."""
     # Create vibrant mesh gradient background
     img = create_mesh_gradient_background(width, height, theme="vibrant")
     draw = ImageDraw.Draw(img)
@@ -580,7 +807,6 @@ def create_unregistered_screen(width: int, height: int, device_uuid: str = None)
     subtitle_font = get_font(FONT_SIZE_SUBTITLE)
     instructions_font = get_font(FONT_SIZE_INSTRUCTIONS, bold=False)
     tagline_font = get_font(FONT_SIZE_TAGLINE)
-    device_font = get_font(FONT_SIZE_DEVICE_ID, bold=False)
 
     center_x = width // 2
 
@@ -602,41 +828,14 @@ def create_unregistered_screen(width: int, height: int, device_uuid: str = None)
         # Fallback: draw a simple placeholder or skip
         y += 40
 
-    # "JAM Player" title with gradient-like orange
-    title = "JAM Player"
-    draw.text(
-        (center_x, y),
-        title,
-        font=title_font,
-        fill=JAM_ORANGE_PRIMARY,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), title, font=title_font)
-    y += bbox[3] + 40
-
-    # Instruction text
-    instruction = "Set up your JAM Player with the JAM Player Setup App."
-    draw.text(
-        (center_x, y),
-        instruction,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), instruction, font=instructions_font)
-    y += bbox[3] + 20
-
-    # "Scan the QR code to begin."
-    scan_text = "Scan the QR code to begin."
-    draw.text(
-        (center_x, y),
-        scan_text,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), scan_text, font=instructions_font)
-    y += bbox[3] + 40
+    y = draw_text_stack(draw, center_x, y, [
+        # "JAM Player" title with gradient-like orange
+        TextLine("JAM Player", title_font, JAM_ORANGE_PRIMARY, gap_after=40),
+        # Instruction text
+        TextLine("Set up your JAM Player with the JAM Player Setup App.", instructions_font, TEXT_COLOR, gap_after=20),
+        # "Scan the QR code to begin."
+        TextLine("Scan the QR code to begin.", instructions_font, TEXT_COLOR, gap_after=40),
+    ])
 
     # QR Code with subtle border/glow effect
     qr_img = generate_qr_code(UNIVERSAL_SETUP_URL, qr_size)
@@ -657,56 +856,34 @@ def create_unregistered_screen(width: int, height: int, device_uuid: str = None)
         img.paste(qr_img, (qr_x, qr_y))
         y += qr_size + 50
 
-    # "Get ready to JAM." tagline
-    tagline = "Get ready to JAM."
-    draw.text(
-        (center_x, y),
-        tagline,
-        font=tagline_font,
-        fill=JAM_ORANGE_SECONDARY,
-        anchor="mt"
-    )
-
-    # Device UUID at bottom (small, subtle)
-    if device_uuid:
-        device_text = f"Device: {device_uuid}"
-        draw.text(
-            (center_x, height - 50),
-            device_text,
-            font=device_font,
-            fill=TEXT_COLOR,
-            anchor="mm"
-        )
-
-    # Version indicator in bottom-right corner
-    version_font = get_font(14, bold=False)
-    draw.text(
-        (width - 30, height - 25),
-        "v2",
-        font=version_font,
-        fill=(80, 80, 80),  # Very subtle
-        anchor="mm"
-    )
+    draw_text_stack(draw, center_x, y, [
+        # "Get ready to JAM." tagline
+        TextLine("Get ready to JAM.", tagline_font, JAM_ORANGE_SECONDARY),
+    ])
 
     return img
 
 
-def create_waiting_for_content_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
+def create_unregistered_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
     """
-    Create the screen for DOWNLOADING_CONTENT mode.
-
-    Modern gradient design showing content download progress message.
+    Create the setup screen for AWAITING_NETWORK mode.
 
-    Footer shows the device UUID (not the screen ID) because any screen
-    that isn't real content should identify the physical JAM Player for
-    support purposes. The screen ID is only meaningful inside the web
-    app; the device UUID is what uniquely identifies the hardware a
-    technician is looking at.
+    Modern gradient design with:
+    - JAM Player logo
+    - "JAM Player" title
+    - Setup instructions
+    - QR code
+    - "Get ready to JAM." tagline
     """
     if not HAS_PIL:
         logger.error("PIL not available for creating display images")
         return None
 
+    return _compose_screen(_build_unregistered_base, width, height, device_uuid)
+
+
+def _build_waiting_for_content_base(width: int, height: int) -> Image.Image:
+    """Build the waiting for content screen without the device footer."""
     # Create cool mesh gradient background for loading state
     img = create_mesh_gradient_background(width, height, theme="cool")
     draw = ImageDraw.Draw(img)
@@ -714,7 +891,6 @@ def create_waiting_for_content_screen(width: int, height: int, device_uuid: str
     # Fonts
     title_font = get_font(FONT_SIZE_TITLE)
     subtitle_font = get_font(FONT_SIZE_SUBTITLE, bold=False)
-    device_font = get_font(FONT_SIZE_DEVICE_ID, bold=False)
 
     center_x = width // 2
     center_y = height // 2
@@ -765,56 +941,36 @@ def create_waiting_for_content_screen(width: int, height: int, device_uuid: str
             fill=dot_color
         )
 
-    # Device UUID at bottom (every non-content screen shows device UUID
-    # so support can identify the physical JAM Player regardless of
-    # setup state).
-    if device_uuid:
-        device_text = f"Device: {device_uuid}"
-        draw.text(
-            (center_x, height - 50),
-            device_text,
-            font=device_font,
-            fill=TEXT_COLOR,
-            anchor="mm"
-        )
-
-    # Version indicator
-    version_font = get_font(14, bold=False)
-    draw.text(
-        (width - 30, height - 25),
-        "v2",
-        font=version_font,
-        fill=(80, 80, 80),
-        anchor="mm"
-    )
-
     return img
 
 
-def create_awaiting_screen_link_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
+def create_waiting_for_content_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
     """
-    Create the screen for AWAITING_SCREEN_LINK mode.
+    Create the screen for DOWNLOADING_CONTENT mode.
 
-    Shown when the device has verified internet connectivity but has not
-    been linked to a Screen yet. Communicates that setup is partially
-    complete and directs the user to the mobile or web app to finish.
+    Modern gradient design showing content download progress message.
 
-    Visually distinct from the AWAITING_NETWORK setup screen: a cool-
-    themed gradient (matches DOWNLOADING_CONTENT's family) emphasizes
-    "you're past the WiFi step"; no primary QR code (the user already
-    has the app open), just device UUID for reference.
+    Footer shows the device UUID (not the screen ID) because any screen
+    that isn't real content should identify the physical JAM Player for
+    support purposes. The screen ID is only meaningful inside the web
+    app; the device UUID is what uniquely identifies the hardware a
+    technician is looking at.
     """
     if not HAS_PIL:
         logger.error("PIL not available for creating display images")
         return None
 
+    return _compose_screen(_build_waiting_for_content_base, width, height, device_uuid)
+
+
+def _build_awaiting_screen_link_base(width: int, height: int) -> Image.Image:
+    """Build the awaiting screen link screen without the device footer."""
     img = create_mesh_gradient_background(width, height, theme="cool")
     draw = ImageDraw.Draw(img)
 
     title_font = get_font(FONT_SIZE_TITLE)
     subtitle_font = get_font(FONT_SIZE_SUBTITLE, bold=False)
     instructions_font = get_font(FONT_SIZE_INSTRUCTIONS, bold=False)
-    device_font = get_font(FONT_SIZE_DEVICE_ID, bold=False)
 
     center_x = width // 2
 
@@ -829,121 +985,56 @@ def create_awaiting_screen_link_screen(width: int, height: int, device_uuid: str
     else:
         y += 40
 
-    # Primary heading: "Registered!" -- the user just completed the
-    # registration step in the mobile app, so this is the appropriate
-    # celebratory checkpoint. "Connected!" was too ambiguous given
-    # AWAITING_REGISTRATION also mentions the device being connected
-    # to the internet.
-    heading = "Registered!"
-    draw.text(
-        (center_x, y),
-        heading,
-        font=title_font,
-        fill=JAM_ORANGE_PRIMARY,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), heading, font=title_font)
-    y += bbox[3] + 20
-
-    # Secondary line: "Almost there."
-    sub = "Almost there."
-    draw.text(
-        (center_x, y),
-        sub,
-        font=subtitle_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), sub, font=subtitle_font)
-    y += bbox[3] + 20
-
-    # Confirmation of the registration state: by the time we reach
-    # AWAITING_SCREEN_LINK we know the .registered flag exists, so this
-    # statement is always accurate here. Helps users understand that
-    # the "link to a screen" step is the only remaining action.
-    status_line = "Your JAM Player is registered to your outlet."
-    draw.text(
-        (center_x, y),
-        status_line,
-        font=subtitle_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), status_line, font=subtitle_font)
-    y += bbox[3] + 40
-
-    # Instruction: link this JAM Player
-    line1 = "Link this JAM Player to a screen"
-    draw.text(
-        (center_x, y),
-        line1,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), line1, font=instructions_font)
-    y += bbox[3] + 12
-
-    line2 = "using the JAM Player Setup app or the web app."
-    draw.text(
-        (center_x, y),
-        line2,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-
-    # Device UUID at the bottom so support / users can identify this JP
-    # in the app / web UI when linking.
-    if device_uuid:
-        device_text = f"Device: {device_uuid}"
-        draw.text(
-            (center_x, height - 50),
-            device_text,
-            font=device_font,
-            fill=TEXT_COLOR,
-            anchor="mm"
-        )
-
-    version_font = get_font(14, bold=False)
-    draw.text(
-        (width - 30, height - 25),
-        "v2",
-        font=version_font,
-        fill=(80, 80, 80),
-        anchor="mm"
-    )
+    draw_text_stack(draw, center_x, y, [
+        # Primary heading: "Registered!" -- the user just completed the
+        # registration step in the mobile app, so this is the appropriate
+        # celebratory checkpoint. "Connected!" was too ambiguous given
+        # AWAITING_REGISTRATION also mentions the device being connected
+        # to the internet.
+        TextLine("Registered!", title_font, JAM_ORANGE_PRIMARY, gap_after=20),
+        # Secondary line: "Almost there."
+        TextLine("Almost there.", subtitle_font, TEXT_COLOR, gap_after=20),
+        # Confirmation of the registration state: by the time we reach
+        # AWAITING_SCREEN_LINK we know the .registered flag exists, so this
+        # statement is always accurate here. Helps users understand that
+        # the "link to a screen" step is the only remaining action.
+        TextLine("Your JAM Player is registered to your outlet.", subtitle_font, TEXT_COLOR, gap_after=40),
+        # Instruction: link this JAM Player
+        TextLine("Link this JAM Player to a screen", instructions_font, TEXT_COLOR, gap_after=12),
+        TextLine("using the JAM Player Setup app or the web app.", instructions_font, TEXT_COLOR),
+    ])
 
     return img
 
 
-def create_awaiting_registration_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
+def create_awaiting_screen_link_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
     """
-    Create the screen for AWAITING_REGISTRATION mode.
+    Create the screen for AWAITING_SCREEN_LINK mode.
 
     Shown when the device has verified internet connectivity but has not
-    been registered to a Location yet. Registration is mobile-app-only
-    (the web app cannot register devices because registration depends
-    on the BLE session the mobile app has open), so this screen directs
-    the user specifically to the mobile app and includes a QR code to
-    the app download / setup landing page.
+    been linked to a Screen yet. Communicates that setup is partially
+    complete and directs the user to the mobile or web app to finish.
 
-    Distinct from AWAITING_SCREEN_LINK, which is shown after the device
-    is registered but not yet linked to a specific Screen; that screen
-    directs the user to either the mobile app or the web app and has no
-    QR code.
+    Visually distinct from the AWAITING_NETWORK setup screen: a cool-
+    themed gradient (matches DOWNLOADING_CONTENT's family) emphasizes
+    "you're past the WiFi step"; no primary QR code (the user already
+    has the app open), just device UUID for reference.
     """
     if not HAS_PIL:
         logger.error("PIL not available for creating display images")
         return None
 
+    return _compose_screen(_build_awaiting_screen_link_base, width, height, device_uuid)
+
+
+def _build_awaiting_registration_base(width: int, height: int) -> Image.Image:
+    """Build the awaiting registration screen without the device footer."""
     img = create_mesh_gradient_background(width, height, theme="cool")
     draw = ImageDraw.Draw(img)
 
     title_font = get_font(FONT_SIZE_TITLE)
     subtitle_font = get_font(FONT_SIZE_SUBTITLE, bold=False)
     instructions_font = get_font(FONT_SIZE_INSTRUCTIONS, bold=False)
-    device_font = get_font(FONT_SIZE_DEVICE_ID, bold=False)
 
     center_x = width // 2
 
@@ -964,68 +1055,21 @@ def create_awaiting_registration_screen(width: int, height: int, device_uuid: st
     else:
         y += 40
 
-    # Primary heading: "Almost there."
-    heading = "Almost there."
-    draw.text(
-        (center_x, y),
-        heading,
-        font=title_font,
-        fill=JAM_ORANGE_PRIMARY,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), heading, font=title_font)
-    y += bbox[3] + 20
-
-    # Status confirmation: explicitly reassure the user that the device
-    # is online. AWAITING_REGISTRATION is only reached when
-    # .internet_verified exists, so this statement is always accurate
-    # here. Helps users understand that the "go to the mobile app" step
-    # is the one remaining action, not a connectivity problem.
-    status_line = "Your JAM Player is connected to the internet."
-    draw.text(
-        (center_x, y),
-        status_line,
-        font=subtitle_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), status_line, font=subtitle_font)
-    y += bbox[3] + 30
-
-    # Instruction line 1
-    line1 = "Set up this JAM Player in the"
-    draw.text(
-        (center_x, y),
-        line1,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), line1, font=instructions_font)
-    y += bbox[3] + 12
-
-    line2 = "JAM Player Setup app on your phone."
-    draw.text(
-        (center_x, y),
-        line2,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), line2, font=instructions_font)
-    y += bbox[3] + 30
-
-    # "Scan the QR code to begin."
-    scan_text = "Scan the QR code to begin."
-    draw.text(
-        (center_x, y),
-        scan_text,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), scan_text, font=instructions_font)
-    y += bbox[3] + 30
+    y = draw_text_stack(draw, center_x, y, [
+        # Primary heading: "Almost there."
+        TextLine("Almost there.", title_font, JAM_ORANGE_PRIMARY, gap_after=20),
+        # Status confirmation: explicitly reassure the user that the device
+        # is online. AWAITING_REGISTRATION is only reached when
+        # .internet_verified exists, so this statement is always accurate
+        # here. Helps users understand that the "go to the mobile app" step
+        # is the one remaining action, not a connectivity problem.
+        TextLine("Your JAM Player is connected to the internet.", subtitle_font, TEXT_COLOR, gap_after=30),
+        # Instruction line 1
+        TextLine("Set up this JAM Player in the", instructions_font, TEXT_COLOR, gap_after=12),
+        TextLine("JAM Player Setup app on your phone.", instructions_font, TEXT_COLOR, gap_after=30),
+        # "Scan the QR code to begin."
+        TextLine("Scan the QR code to begin.", instructions_font, TEXT_COLOR, gap_after=30),
+    ])
 
     # QR Code pointing at the mobile-app setup landing page.
     qr_img = generate_qr_code(UNIVERSAL_SETUP_URL, qr_size)
@@ -1042,26 +1086,60 @@ def create_awaiting_registration_screen(width: int, height: int, device_uuid: st
         )
         img.paste(qr_img, (qr_x, qr_y))
 
-    # Device UUID at the bottom
-    if device_uuid:
-        device_text = f"Device: {device_uuid}"
-        draw.text(
-            (center_x, height - 50),
-            device_text,
-            font=device_font,
-            fill=TEXT_COLOR,
-            anchor="mm"
-        )
+    return img
 
-    # Version indicator
-    version_font = get_font(14, bold=False)
-    draw.text(
-        (width - 30, height - 25),
-        "v2",
-        font=version_font,
-        fill=(80, 80, 80),
-        anchor="mm"
-    )
+
+def create_awaiting_registration_screen(width: int, height: int, device_uuid: str = None) -> Image.Image:
+    """
+    Create the screen for AWAITING_REGISTRATION mode.
+
+    Shown when the device has verified internet connectivity but has not
+    been registered to a Location yet. Registration is mobile-app-only
+    (the web app cannot register devices because registration depends
+    on the BLE session the mobile app has open), so this screen directs
+    the user specifically to the mobile app and includes a QR code to
+    the app download / setup landing page.
+
+    Distinct from AWAITING_SCREEN_LINK, which is shown after the device
+    is registered but not yet linked to a specific Screen; that screen
+    directs the user to either the mobile app or the web app and has no
+    QR code.
+    """
+    if not HAS_PIL:
+        logger.error("PIL not available for creating display images")
+        return None
+
+    return _compose_screen(_build_awaiting_registration_base, width, height, device_uuid)
+
+
+def _build_no_active_scenes_base(width: int, height: int) -> Image.Image:
+    """Build the no active scenes screen without the device footer."""
+    img = create_mesh_gradient_background(width, height, theme="vibrant")
+    draw = ImageDraw.Draw(img)
+
+    title_font = get_font(FONT_SIZE_TITLE)
+    subtitle_font = get_font(FONT_SIZE_SUBTITLE, bold=False)
+    instructions_font = get_font(FONT_SIZE_INSTRUCTIONS, bold=False)
+
+    center_x = width // 2
+
+    logo_height = min(120, height // 8)
+    y = int(height * 0.12)
+    logo = load_and_scale_logo(logo_height)
+    if logo:
+        logo_x = center_x - logo.width // 2
+        img.paste(logo, (logo_x, y), logo if logo.mode == 'RGBA' else None)
+        y += logo.height + 40
+    else:
+        y += 40
+
+    draw_text_stack(draw, center_x, y, [
+        # Heading: make clear this is not a download problem
+        TextLine("No active scenes", title_font, JAM_ORANGE_PRIMARY, gap_after=30),
+        TextLine("This screen has nothing scheduled right now.", subtitle_font, TEXT_COLOR, gap_after=50),
+        TextLine("Add scenes to this screen in the web app", instructions_font, TEXT_COLOR, gap_after=12),
+        TextLine("to display content here.", instructions_font, TEXT_COLOR),
+    ])
 
     return img
 
@@ -1089,82 +1167,60 @@ def create_no_active_scenes_screen(width: int, height: int, device_uuid: str = N
         logger.error("PIL not available for creating display images")
         return None
 
-    img = create_mesh_gradient_background(width, height, theme="vibrant")
+    return _compose_screen(_build_no_active_scenes_base, width, height, device_uuid)
+
+
+def create_no_scheduled_content_screen(width: int, height: int) -> Image.Image:
+    """
+    Create the screen shown while content exists but every scene is
+    scheduled off right now.
+
+    Unlike the setup screens this one shows a version tag instead of the
+    device UUID footer.
+    """
+    if not HAS_PIL:
+        logger.error("PIL not available for creating display images")
+        return None
+
+    # Warm mesh gradient for "off hours" theme
+    img = create_mesh_gradient_background(width, height, theme="warm")
     draw = ImageDraw.Draw(img)
 
     title_font = get_font(FONT_SIZE_TITLE)
     subtitle_font = get_font(FONT_SIZE_SUBTITLE, bold=False)
-    instructions_font = get_font(FONT_SIZE_INSTRUCTIONS, bold=False)
-    device_font = get_font(FONT_SIZE_DEVICE_ID, bold=False)
 
     center_x = width // 2
+    center_y = height // 2
 
-    logo_height = min(120, height // 8)
-    y = int(height * 0.12)
+    # Logo at top
+    logo_height = min(80, height // 10)
     logo = load_and_scale_logo(logo_height)
     if logo:
         logo_x = center_x - logo.width // 2
-        img.paste(logo, (logo_x, y), logo if logo.mode == 'RGBA' else None)
-        y += logo.height + 40
-    else:
-        y += 40
+        logo_y = int(height * 0.15)
+        img.paste(logo, (logo_x, logo_y), logo if logo.mode == 'RGBA' else None)
 
-    # Heading: make clear this is not a download problem
-    heading = "No active scenes"
+    # Title
+    title = "No Content Scheduled"
     draw.text(
-        (center_x, y),
-        heading,
+        (center_x, center_y - 30),
+        title,
         font=title_font,
         fill=JAM_ORANGE_PRIMARY,
-        anchor="mt"
+        anchor="mm"
     )
-    bbox = draw.textbbox((0, 0), heading, font=title_font)
-    y += bbox[3] + 30
 
-    sub = "This screen has nothing scheduled right now."
+    # Subtitle
+    subtitle = "Content will appear during scheduled hours."
     draw.text(
-        (center_x, y),
-        sub,
+        (center_x, center_y + 40),
+        subtitle,
         font=subtitle_font,
         fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), sub, font=subtitle_font)
-    y += bbox[3] + 50
-
-    line1 = "Add scenes to this screen in the web app"
-    draw.text(
-        (center_x, y),
-        line1,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
-    )
-    bbox = draw.textbbox((0, 0), line1, font=instructions_font)
-    y += bbox[3] + 12
-
-    line2 = "to display content here."
-    draw.text(
-        (center_x, y),
-        line2,
-        font=instructions_font,
-        fill=TEXT_COLOR,
-        anchor="mt"
+        anchor="mm"
     )
 
-    # Device UUID at bottom (every non-content screen shows device UUID
-    # so support can identify the physical JAM Player regardless of
-    # setup state).
-    if device_uuid:
-        device_text = f"Device: {device_uuid}"
-        draw.text(
-            (center_x, height - 50),
-            device_text,
-            font=device_font,
-            fill=TEXT_COLOR,
-            anchor="mm"
-        )
-
+    # Version indicator
     version_font = get_font(14, bold=False)
     draw.text(
         (width - 30, height - 25),
@@ -1177,12 +1233,47 @@ def create_no_active_scenes_screen(width: int, height: int, device_uuid: str = N
     return img
 
 
+# Static (feh) modes: image name and the function rendering the screen
+STATIC_SCREENS = {
+    DisplayMode.AWAITING_NETWORK: ("jam_display_awaiting_network", create_unregistered_screen),
+    DisplayMode.AWAITING_REGISTRATION: ("jam_display_awaiting_registration", create_awaiting_registration_screen),
+    DisplayMode.AWAITING_SCREEN_LINK: ("jam_display_awaiting_screen_link", create_awaiting_screen_link_screen),
+    DisplayMode.DOWNLOADING_CONTENT: ("jam_display_downloading", create_waiting_for_content_screen),
+    DisplayMode.NO_ACTIVE_SCENES: ("jam_display_no_active_scenes", create_no_active_scenes_screen),
+}
+
+
+def display_image_path(img_name: str) -> str:
+    """Get the file path a rendered screen is shown from."""
+    return os.path.join(DISPLAY_IMAGE_DIR, f'{img_name}.png')
+
+
+def save_display_image(img: Image.Image, img_path: str) -> None:
+    """
+    Save a rendered screen for feh.
+
+    Written to a temporary file and renamed into place, so a running feh
+    (or the reuse check) never sees a half-written PNG.
+    """
+    tmp_path = f'{img_path}.tmp'
+    try:
+        img.save(tmp_path, 'PNG', compress_level=DISPLAY_PNG_COMPRESS_LEVEL, optimize=False)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, img_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def create_fallback_image(width: int, height: int, message: str, img_name: str) -> Optional[str]:
     """
     Create a simple fallback image using ImageMagick when PIL fails.
     Returns the path to the created image, or None if ImageMagick also fails.
     """
-    img_path = f'/tmp/{img_name}.png'
+    img_path = display_image_path(img_name)
     try:
         # Use ImageMagick to create a simple text image
         result = subprocess.run([
@@ -1210,7 +1301,7 @@ def create_fallback_image(width: int, height: int, message: str, img_name: str)
 
 def display_image_with_feh(img: Image.Image, img_name: str = "jam_display", fallback_message: str = None) -> Optional[subprocess.Popen]:
     """Display an image fullscreen using feh. Returns the process handle."""
-    img_path = f'/tmp/{img_name}.png'
+    img_path = display_image_path(img_name)
 
     if img is None:
         if fallback_message:
@@ -1225,21 +1316,82 @@ def display_image_with_feh(img: Image.Image, img_name: str = "jam_display", fall
             logger.error("No image to display and no fallback message provided")
             return None
     else:
-        img.save(img_path, 'PNG')
-        os.chmod(img_path, 0o644)
+        save_display_image(img, img_path)
+
+    return launch_feh(img_path)
+
+
+def _x_socket_accepts() -> bool:
+    """Check whether the X server is accepting connections on its unix socket."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            sock.connect(X11_SOCKET_PATH)
+        return True
+    except OSError:
+        return False
+
+
+def _xdpyinfo_succeeds() -> bool:
+    """Check whether the X display answers xdpyinfo as the display user."""
+    result = subprocess.run(
+        ['sudo', '-u', 'comitup', 'env', 'DISPLAY=:0', 'xdpyinfo'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+
+def wait_for_x_display(timeout: float = DISPLAY_WAIT_TIMEOUT_SEC) -> bool:
+    """
+    Wait until the X display is available.
+
+    Connecting to the X server's socket is enough to know it is up. If the
+    socket file isn't there (not started yet, or a server listening only on
+    the abstract namespace) fall back to running xdpyinfo.
+
+    Args:
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the display is available, False on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if os.path.exists(X11_SOCKET_PATH):
+            if _x_socket_accepts():
+                return True
+            poll_interval = DISPLAY_SOCKET_POLL_SEC
+        else:
+            if _xdpyinfo_succeeds():
+                return True
+            poll_interval = DISPLAY_XDPYINFO_POLL_SEC
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(poll_interval, remaining))
+
 
-    # Wait for X display to be available
-    for _ in range(30):
-        result = subprocess.run(
-            ['sudo', '-u', 'comitup', 'env', 'DISPLAY=:0', 'xdpyinfo'],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        if result.returncode == 0:
-            break
-        time.sleep(1)
-    else:
-        logger.warning("Display not available after 30s")
+# feh processes started by this service instance (sudo wrappers; sudo
+# relays SIGTERM to feh)
+_feh_processes: List[subprocess.Popen] = []
+
+# Set once feh left over from a previous run has been pkill'ed; every feh
+# after that is one we launched and track above
+_stray_feh_killed = False
+
+
+def launch_feh(img_path: str) -> Optional[subprocess.Popen]:
+    """
+    Show an existing image file fullscreen using feh. Returns the process handle.
+
+    Static screens go through X like video does rather than being written
+    to /dev/fb0: the X server owns the display, so anything drawn to the
+    framebuffer behind its back is painted over on its next redraw.
+    """
+    if not wait_for_x_display():
+        logger.warning(f"Display not available after {DISPLAY_WAIT_TIMEOUT_SEC}s")
         return None
 
     # Launch feh
@@ -1249,17 +1401,42 @@ def display_image_with_feh(img: Image.Image, img_name: str = "jam_display", fall
         stderr=subprocess.DEVNULL,
         start_new_session=True
     )
+    _feh_processes.append(process)
     return process
 
 
 def kill_feh_processes():
-    """Kill any feh processes we started."""
+    """
+    Kill any feh processes we started.
+
+    Processes we launched are signalled directly through their Popen
+    handles, which check the process hasn't already been reaped, so a
+    recycled PID is never signalled. pkill is only run once, to catch feh
+    left over from a previous run; repeated calls during one transition
+    (e.g. transition_to_mode followed by _start_video_playback) then cost
+    nothing once our own feh is gone.
+    """
+    global _stray_feh_killed
+
+    if _feh_processes:
+        for process in _feh_processes:
+            try:
+                if process.poll() is None:
+                    process.terminate()
+            except Exception as e:
+                logger.debug(f"Failed to stop feh (PID {process.pid}): {e}")
+        _feh_processes.clear()
+
+    if _stray_feh_killed:
+        return
+
     try:
         subprocess.run(
             ['pkill', '-f', 'feh.*jam_display'],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
+        _stray_feh_killed = True
     except:
         pass
 
@@ -1268,6 +1445,36 @@ def kill_feh_processes():
 # MPV IPC Client (for video playback)
 # =============================================================================
 
+# Demuxer buffering for scene mode (loop=False), where MPV is kept running
+# and each scene is a short local clip loaded with loadfile. MPV's defaults
+# (150MiB forward, 50MiB back buffer) are sized for network streams; scene
+# clips are read from the SD card, and seeking back is a fresh read.
+# Legacy single-video mode keeps MPV's defaults.
+MPV_SCENE_DEMUXER_MAX_BYTES = "32MiB"
+MPV_SCENE_DEMUXER_MAX_BACK_BYTES = "0"
+
+# Longest wait for MPV to report a loaded file before changing properties
+# that only apply to it
+MPV_FILE_LOADED_TIMEOUT_SEC = 2
+# Fixed delay used instead when MPV's events can't be received
+MPV_LOAD_SETTLE_SEC = 0.1
+
+
+def _encode_ipc_message(message: dict) -> bytes:
+    """Encode one MPV IPC message as a newline-terminated JSON line."""
+    return (json.dumps(message) + '\n').encode('utf-8')
+
+
+def _decode_ipc_line(line: bytes) -> Any:
+    """
+    Decode one JSON line received from MPV.
+
+    Raises:
+        json.JSONDecodeError: If the line isn't valid JSON.
+    """
+    return json.loads(line)
+
+
 class MpvIpcClient:
     """Client for controlling MPV via JSON IPC protocol."""
 
@@ -1276,6 +1483,16 @@ class MpvIpcClient:
         self.process: Optional[subprocess.Popen] = None
         self.socket: Optional[socket.socket] = None
         self._request_id = 0
+        # Bytes received after the last complete line
+        self._recv_buf = b''
+        # Serializes use of the shared IPC connection
+        self._lock = threading.Lock()
+
+        # Set by load_file() until MPV reports the new file starting, so a
+        # late file-loaded event about the previous file isn't taken for it
+        self._awaiting_file_start = False
+        # Set when MPV reports the file from the last load_file() loaded
+        self._file_loaded = False
 
     def start_mpv(self, rotation_angle: int = 0, loop: bool = True, initial_file: str = None) -> bool:
         """Start MPV process with IPC socket enabled.
@@ -1317,6 +1534,11 @@ class MpvIpcClient:
         # Add loop option only for legacy single-video mode
         if loop:
             mpv_args.insert(-1, '--loop-file=inf')
+        else:
+            mpv_args[-1:-1] = [
+                f'--demuxer-max-bytes={MPV_SCENE_DEMUXER_MAX_BYTES}',
+                f'--demuxer-max-back-bytes={MPV_SCENE_DEMUXER_MAX_BACK_BYTES}',
+            ]
 
         # Build command: run as comitup user for X11 access (service runs as root)
         args = ['sudo', '-u', 'comitup', 'env', f'DISPLAY=:0'] + mpv_args
@@ -1351,12 +1573,8 @@ class MpvIpcClient:
 
     def stop_mpv(self):
         """Stop the MPV process and clean up."""
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
+        with self._lock:
+            self._disconnect()
 
         if self.process:
             try:
@@ -1384,14 +1602,23 @@ class MpvIpcClient:
             self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self.socket.connect(self.socket_path)
             self.socket.settimeout(2.0)
+            # The connection stays open, so only take the events
+            # wait_for_file_loaded() needs; others would queue up unread.
+            # The replies have no request_id and are skipped.
+            self.socket.sendall(b''.join(_encode_ipc_message({'command': c}) for c in (
+                ['disable_event', 'all'],
+                ['enable_event', 'start-file'],
+                ['enable_event', 'file-loaded'],
+            )))
             return True
         except Exception as e:
             logger.error(f"Failed to connect to MPV socket: {e}")
-            self.socket = None
+            self._disconnect()
             return False
 
-    def _send_command(self, command: list, wait_response: bool = True) -> Optional[Any]:
-        """Send a command to MPV via IPC."""
+    def _disconnect(self):
+        """Close the MPV socket, if open."""
+        self._recv_buf = b''
         if self.socket:
             try:
                 self.socket.close()
@@ -1399,62 +1626,136 @@ class MpvIpcClient:
                 pass
             self.socket = None
 
-        if not self._connect():
-            return None
+    def _send_command(self, command: list, wait_response: bool = True) -> Optional[Any]:
+        """Send a command to MPV via IPC."""
+        return self._send_commands([command], wait_response)[0]
 
-        self._request_id += 1
-        request = {
-            'command': command,
-            'request_id': self._request_id
-        }
+    def _send_commands(self, commands: List[list], wait_response: bool = True) -> List[Optional[Any]]:
+        """
+        Send commands to MPV in a single write; MPV runs them in order.
 
-        try:
-            msg = json.dumps(request) + '\n'
-            self.socket.sendall(msg.encode('utf-8'))
-
-            if wait_response:
-                response_data = b''
-                while True:
-                    chunk = self.socket.recv(4096)
-                    if not chunk:
-                        break
-                    response_data += chunk
-                    if b'\n' in response_data:
-                        break
-
-                decoded = response_data.decode('utf-8').strip()
-                for line in decoded.split('\n'):
-                    if line:
-                        try:
-                            resp = json.loads(line)
-                            if resp.get('request_id') == self._request_id:
-                                if resp.get('error') == 'success':
-                                    return resp.get('data')
-                                else:
-                                    err = resp.get('error', '')
-                                    if 'unavailable' not in err.lower():
-                                        logger.warning(f"MPV command {command[0]} error: {err}")
-                                    return None
-                        except json.JSONDecodeError:
-                            continue
+        The connection is kept open between commands. If MPV has closed it
+        (e.g. after a restart) the commands are retried once on a fresh
+        connection.
 
-            return None
+        Returns:
+            Each command's result data, or None where it failed.
+        """
+        with self._lock:
+            for attempt in range(2):
+                if not self._connect():
+                    break
 
-        except Exception as e:
-            logger.error(f"Failed to send command to MPV: {e}")
+                try:
+                    return self._exchange(commands, wait_response)
+                except (BrokenPipeError, ConnectionResetError) as e:
+                    self._disconnect()
+                    if attempt == 0:
+                        logger.debug(f"MPV socket closed ({e}), reconnecting")
+                        continue
+                    logger.error(f"Failed to send command to MPV: {e}")
+                except Exception as e:
+                    logger.error(f"Failed to send command to MPV: {e}")
+                    self._disconnect()
+                break
+        return [None] * len(commands)
+
+    def _exchange(self, commands: List[list], wait_response: bool) -> List[Optional[Any]]:
+        """
+        Write commands and read until all their replies arrive.
+
+        Events MPV pushes are handed to _handle_event(), and a reply to an
+        earlier timed-out command may still be pending, so lines that don't
+        carry one of our request_ids are otherwise skipped.
+
+        Raises:
+            ConnectionResetError: If MPV closed the connection.
+            OSError: On socket errors, including timeouts.
+        """
+        pending: Dict[int, int] = {}  # request_id -> index in commands
+        messages = []
+        for index, command in enumerate(commands):
+            self._request_id += 1
+            pending[self._request_id] = index
+            messages.append(_encode_ipc_message({
+                'command': command,
+                'request_id': self._request_id
+            }))
+
+        self.socket.sendall(b''.join(messages))
+
+        results: List[Optional[Any]] = [None] * len(commands)
+        if not wait_response:
+            return results
+
+        while pending:
+            for resp in self._receive_messages():
+                index = pending.pop(resp.get('request_id'), None)
+                if index is None:
+                    continue
+                if resp.get('error') == 'success':
+                    results[index] = resp.get('data')
+                    continue
+                err = resp.get('error', '')
+                if 'unavailable' not in err.lower():
+                    logger.warning(f"MPV command {commands[index][0]} error: {err}")
+
+        return results
+
+    def _receive_messages(self) -> List[dict]:
+        """
+        Read once from the socket and decode the complete lines received.
+
+        Only complete lines are parsed; a trailing partial line stays
+        buffered for the next read. Events are applied before returning.
+
+        Raises:
+            ConnectionResetError: If MPV closed the connection.
+            OSError: On socket errors, including timeouts.
+        """
+        chunk = self.socket.recv(4096)
+        if not chunk:
+            raise ConnectionResetError("MPV closed the IPC connection")
+        self._recv_buf += chunk
+
+        end = self._recv_buf.rfind(b'\n')
+        if end < 0:
+            return []
+        lines = self._recv_buf[:end].split(b'\n')
+        self._recv_buf = self._recv_buf[end + 1:]
+
+        messages = []
+        for line in lines:
+            if not line:
+                continue
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            return None
+                msg = _decode_ipc_line(line)
+            except json.JSONDecodeError:
+                continue
+            if 'event' in msg:
+                self._handle_event(msg)
+            messages.append(msg)
+        return messages
+
+    def _handle_event(self, msg: dict):
+        """Track the start-file/file-loaded events for wait_for_file_loaded()."""
+        event = msg.get('event')
+        if event == 'start-file':
+            self._awaiting_file_start = False
+        elif event == 'file-loaded' and not self._awaiting_file_start:
+            self._file_loaded = True
 
     def load_file(self, filepath: str) -> bool:
         """Load a media file into MPV and start playback."""
-        self._send_command(['loadfile', filepath, 'replace'])
-        # Ensure playback starts (MPV may be paused in idle mode)
-        time.sleep(0.1)
-        self.set_property('pause', False)
+        with self._lock:
+            self._awaiting_file_start = True
+            self._file_loaded = False
+        # Ensure playback starts (MPV may be paused in idle mode). MPV runs
+        # commands in order, so unpausing can go in the same write.
+        self._send_commands([
+            ['loadfile', filepath, 'replace'],
+            ['set_property', 'pause', False],
+        ])
         return True
 
     def seek(self, position_seconds: float) -> bool:
@@ -1469,9 +1770,45 @@ class MpvIpcClient:
         """Get an MPV property value."""
         return self._send_command(['get_property', name])
 
-    def get_duration(self) -> Optional[float]:
-        """Get the duration of the current file in seconds."""
-        return self.get_property('duration')
+    def wait_for_file_loaded(self, timeout: float = MPV_FILE_LOADED_TIMEOUT_SEC) -> bool:
+        """
+        Wait until MPV has loaded the file from the last load_file().
+
+        Reads MPV's events off the command connection. If that connection
+        can't be used, this just waits MPV_LOAD_SETTLE_SEC and returns False.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if MPV reported the file loaded.
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            if self._file_loaded:
+                return True
+            if not self._connect():
+                time.sleep(MPV_LOAD_SETTLE_SEC)
+                return False
+
+            previous_timeout = self.socket.gettimeout()
+            try:
+                while not self._file_loaded:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self.socket.settimeout(remaining)
+                    self._receive_messages()
+            except socket.timeout:
+                return False
+            except OSError as e:
+                logger.debug(f"MPV connection lost waiting for file-loaded: {e}")
+                self._disconnect()
+                return False
+            finally:
+                if self.socket:
+                    self.socket.settimeout(previous_timeout)
+        return True
 
     def get_playback_time(self) -> Optional[float]:
         """Get the current playback position in seconds."""
@@ -1499,12 +1836,52 @@ class JamPlayerDisplayManager:
         self.mpv: Optional[MpvIpcClient] = None
         self.is_playing: bool = False
 
+        self._watchdog = WatchdogPinger(WATCHDOG_PING_INTERVAL_SEC)
+
         # MPV crash tracking for self-healing
         # If MPV crashes too many times in a short period, restart lightdm
         self._mpv_crash_times: list = []
         self._mpv_crash_threshold = 5  # Number of crashes
         self._mpv_crash_window_seconds = 30  # Time window to track crashes
 
+        # Inputs each static screen image file was last rendered from,
+        # keyed by image name - lets feh restarts and mode flips reuse it
+        self._rendered_screens: Dict[str, tuple] = {}
+
+        # Content locations, looked up several times per second while playing
+        self._scenes_file = Path(constants.APP_DATA_LIVE_SCENES_DIR) / "scenes.json"
+        self._media_dir = Path(constants.APP_DATA_LIVE_MEDIA_DIR)
+
+        # ((mtime_ns, size), scenes) of the last parsed scenes.json
+        self._scenes_cache: Optional[tuple] = None
+
+        # inotify watch on the scenes and media directories while playing
+        self._content_watcher: Optional[DirectoryWatcher] = None
+        # Names in the media directory, rescanned after it changes
+        self._media_files: Optional[set] = None
+
+        # Flags and screen_id live in the device data dir; scenes.json and
+        # media decide the content modes
+        self._state_watcher = DirectoryWatcher([
+            DEVICE_DATA_DIR,
+            self._scenes_file.parent,
+            self._media_dir,
+        ])
+        # (mode, monotonic expiry) of the last determine_display_mode()
+        self._cached_mode: Optional[tuple] = None
+        # (feh Popen, pidfd) the main loop waits on in static modes
+        self._feh_pidfd: Optional[tuple] = None
+        # Monotonic time the main loop last restarted an exited feh
+        self._last_feh_restart = 0.0
+
+        # Renders static screen files off the main loop: the next screen
+        # while the old mode is torn down, and the other setup screens while
+        # one is showing. One worker: screens share a canvas, so only one
+        # renders at a time.
+        self._render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='screen-render')
+        # (inputs, future) of the last render queued for each image name
+        self._render_jobs: Dict[str, tuple] = {}
+
         # Get screen dimensions
         self.screen_width, self.screen_height = get_fb_size()
         logger.info(f"Screen dimensions: {self.screen_width}x{self.screen_height}")
@@ -1516,7 +1893,9 @@ class JamPlayerDisplayManager:
     def _signal_handler(self, signum, frame):
         logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
-        self.cleanup()
+        # Unwind the main loop and let run()'s finally clean up. Cleaning
+        # up from here could deadlock: the signal may interrupt the main
+        # thread while it holds the MPV IPC lock.
         sys.exit(0)
 
     def cleanup(self):
@@ -1537,10 +1916,88 @@ class JamPlayerDisplayManager:
             self.mpv.stop_mpv()
             self.mpv = None
 
+        self._render_pool.shutdown(wait=False, cancel_futures=True)
+
+        if self._content_watcher is not None:
+            self._content_watcher.close()
+            self._content_watcher = None
+
+        self._state_watcher.close()
+
+        if self._feh_pidfd is not None:
+            os.close(self._feh_pidfd[1])
+            self._feh_pidfd = None
+
+    def _wait_for_state_change(self, timeout: float, wake_fds: tuple = ()) -> bool:
+        """
+        Wait for a change in any directory the display mode depends on.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            wake_fds: File descriptors that also end the wait when readable
+
+        Returns:
+            True if something changed (the cached display mode is dropped).
+        """
+        if self._state_watcher.wait(timeout, wake_fds):
+            self._cached_mode = None
+            return True
+        return False
+
+    def _feh_exit_fd(self) -> Optional[int]:
+        """
+        Get a pidfd that becomes readable when the current feh exits.
+
+        Lets the main loop sleep until feh dies instead of polling it.
+        feh_process is our child and only reaped by poll(), so its PID
+        can't be reused before the pidfd is opened.
+
+        Returns:
+            The pidfd, or None if there is no feh or pidfds aren't
+            supported (Linux < 5.3).
+        """
+        process = self.feh_process
+        if self._feh_pidfd is not None:
+            if self._feh_pidfd[0] is process:
+                return self._feh_pidfd[1]
+            os.close(self._feh_pidfd[1])
+            self._feh_pidfd = None
+
+        if process is None:
+            return None
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError) as e:
+            logger.debug(f"pidfd unavailable for feh (PID {process.pid}): {e}")
+            return None
+        self._feh_pidfd = (process, pidfd)
+        return pidfd
+
     def determine_display_mode(self) -> DisplayMode:
         """
         Determine which display mode we should be in based on current state.
 
+        The result is cached until the state watcher sees a change in the
+        device data, scenes or media directory, so the periodic checks in
+        the main loop and while playing cost a non-blocking read instead of
+        a round of file checks. The cache also expires after
+        STATE_CHECK_WATCHED_INTERVAL_SEC as a safety net, and isn't used
+        at all while a directory is unwatched.
+        """
+        self._wait_for_state_change(0)
+        if not self._state_watcher.has_all_watches:
+            return self._resolve_display_mode()
+
+        now = time.monotonic()
+        if self._cached_mode is None or now >= self._cached_mode[1]:
+            self._cached_mode = (self._resolve_display_mode(),
+                                 now + STATE_CHECK_WATCHED_INTERVAL_SEC)
+        return self._cached_mode[0]
+
+    def _resolve_display_mode(self) -> DisplayMode:
+        """
+        Work out the display mode from the flag, screen ID and content files.
+
         CRITICAL: content availability is checked FIRST, before any
         network/setup-state checks. JAM Players are required to support
         offline playback -- a device that was previously set up and
@@ -1619,13 +2076,10 @@ class JamPlayerDisplayManager:
         "no scenes configured" when we actually just failed to read the
         file would be misleading.
         """
-        scenes_file = Path(constants.APP_DATA_LIVE_SCENES_DIR) / "scenes.json"
-        if not scenes_file.exists():
-            return DisplayMode.DOWNLOADING_CONTENT
-
         try:
-            with open(scenes_file, 'r') as f:
-                scenes = json.load(f)
+            scenes = self._read_scenes()
+        except FileNotFoundError:
+            return DisplayMode.DOWNLOADING_CONTENT
         except Exception as e:
             logger.warning(f"Error reading scenes.json, treating as downloading: {e}")
             return DisplayMode.DOWNLOADING_CONTENT
@@ -1637,12 +2091,18 @@ class JamPlayerDisplayManager:
             return DisplayMode.NO_ACTIVE_SCENES
 
         # Scenes are listed. If at least one media file is on disk, we
-        # can play. Otherwise, treat as still-downloading.
-        media_dir = Path(constants.APP_DATA_LIVE_MEDIA_DIR)
-        for scene in scenes:
-            media_file = scene.get('media_file')
-            if media_file and (media_dir / media_file).exists():
-                return DisplayMode.PLAYING_CONTENT
+        # can play. Otherwise, treat as still-downloading. One directory
+        # listing answers this for every scene.
+        try:
+            media_files = self._list_media_dir()
+        except FileNotFoundError:
+            return DisplayMode.DOWNLOADING_CONTENT
+        except OSError as e:
+            logger.warning(f"Cannot list media directory, treating as downloading: {e}")
+            return DisplayMode.DOWNLOADING_CONTENT
+
+        if any(scene.get('media_file') in media_files for scene in scenes):
+            return DisplayMode.PLAYING_CONTENT
 
         return DisplayMode.DOWNLOADING_CONTENT
 
@@ -1657,25 +2117,204 @@ class JamPlayerDisplayManager:
         Returns:
             List of scene dicts, sorted by order, optionally filtered by schedule.
         """
-        scenes_file = Path(constants.APP_DATA_LIVE_SCENES_DIR) / "scenes.json"
-        if not scenes_file.exists():
-            return []
-
         try:
-            with open(scenes_file, 'r') as f:
-                scenes = json.load(f)
-            # Sort by order
-            scenes.sort(key=lambda s: s.get('order', 0))
+            scenes = self._read_scenes()
 
             # Filter by schedule if requested
             if apply_schedule_filter:
                 scenes = filter_scenes_by_schedule(scenes)
 
             return scenes
+        except FileNotFoundError:
+            return []
         except Exception as e:
             logger.error(f"Error loading scenes: {e}")
             return []
 
+    def _read_scenes(self) -> list:
+        """
+        Read scenes.json, sorted by order.
+
+        The parsed list is cached and only re-read when the file's mtime or
+        size changes; display mode checks and the playback loop both read
+        it far more often than it is rewritten. Callers get their own copy
+        of each scene dict, so they can annotate them freely.
+
+        Raises:
+            FileNotFoundError: If scenes.json doesn't exist.
+            Exception: If it can't be read or parsed.
+        """
+        st = self._scenes_file.stat()
+        key = (st.st_mtime_ns, st.st_size)
+
+        if self._scenes_cache is None or self._scenes_cache[0] != key:
+            with open(self._scenes_file, 'r') as f:
+                scenes = json.load(f)
+            # Sort by order
+            scenes.sort(key=lambda s: s.get('order', 0))
+            for scene in scenes:
+                scene['_schedule'] = compile_schedule(scene.get('days_scheduled', []))
+            self._scenes_cache = (key, scenes)
+
+        return [dict(scene) for scene in self._scenes_cache[1]]
+
+    def _has_content(self) -> bool:
+        """
+        Check whether there is playable content, ignoring the schedule.
+
+        Distinguishes "everything is scheduled off right now" from "there
+        is nothing to play at all" for the playback loop.
+        """
+        return self._get_content_display_mode() == DisplayMode.PLAYING_CONTENT
+
+    def _screen_inputs(self, device_uuid: Optional[str]) -> tuple:
+        """Inputs a static screen render depends on."""
+        return (self.screen_width, self.screen_height, device_uuid)
+
+    def _is_rendered(self, img_name: str, inputs: tuple) -> bool:
+        """Check whether the image file for img_name was rendered from inputs."""
+        return (self._rendered_screens.get(img_name) == inputs
+                and os.path.exists(display_image_path(img_name)))
+
+    def _render_screen_file(self, img_name: str, render, inputs: tuple) -> bool:
+        """
+        Render a static screen and save it as its display image.
+
+        Runs on the render pool.
+
+        Returns:
+            True if the image file was written.
+        """
+        width, height, device_uuid = inputs
+        try:
+            img = render(width, height, device_uuid)
+            if img is None:
+                return False
+            save_display_image(img, display_image_path(img_name))
+        except Exception as e:
+            logger.error(f"Failed to render {img_name}: {e}")
+            return False
+        self._rendered_screens[img_name] = inputs
+        return True
+
+    def _queue_screen_render(self, mode: DisplayMode, device_uuid: Optional[str]):
+        """
+        Make sure a static mode's screen file is rendered or being rendered.
+
+        Returns:
+            The future of the queued (or already queued) render, or None
+            if the image on disk can be reused as-is.
+        """
+        img_name, render = STATIC_SCREENS[mode]
+        inputs = self._screen_inputs(device_uuid)
+        if self._is_rendered(img_name, inputs):
+            return None
+
+        job = self._render_jobs.get(img_name)
+        if job is not None and job[0] == inputs and not job[1].cancelled():
+            return job[1]
+
+        future = self._render_pool.submit(self._render_screen_file, img_name, render, inputs)
+        self._render_jobs[img_name] = (inputs, future)
+        return future
+
+    def _start_static_screen_render(self, mode: DisplayMode, device_uuid: Optional[str]):
+        """
+        Start rendering a static mode's screen in the background.
+
+        Called before the old mode is cleaned up, so stopping MPV or feh
+        overlaps with rendering. Pre-renders of other screens that haven't
+        started yet are dropped so this one is next.
+        """
+        self._cancel_screen_renders(keep=STATIC_SCREENS[mode][0])
+        self._queue_screen_render(mode, device_uuid)
+
+    def _cancel_screen_renders(self, keep: Optional[str] = None):
+        """
+        Drop queued screen renders that haven't started yet.
+
+        A render already in progress can't be interrupted and runs to the
+        end; at most one does, as the pool has a single worker.
+
+        Args:
+            keep: Image name whose render is left queued, if any
+        """
+        for name, (_, future) in self._render_jobs.items():
+            if name != keep:
+                future.cancel()
+
+    def _wait_for_screen_render(self, img_name: str, future) -> None:
+        """
+        Wait for a queued screen render, pinging the watchdog meanwhile.
+
+        Gives up after SCREEN_RENDER_WAIT_TIMEOUT_SEC or on shutdown; the
+        render keeps going in the background and is reused next time.
+        """
+        deadline = time.monotonic() + SCREEN_RENDER_WAIT_TIMEOUT_SEC
+        while True:
+            self._watchdog.ping_if_due()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.running:
+                logger.warning(f"Render of {img_name} did not finish in time")
+                return
+            try:
+                future.result(timeout=min(WATCHDOG_PING_INTERVAL_SEC, remaining))
+                return
+            except FutureTimeoutError:
+                continue
+            except Exception as e:
+                # Cancelled by shutdown
+                logger.warning(f"Render of {img_name} did not finish: {e}")
+                return
+
+    def _prerender_static_screens(self, device_uuid: Optional[str]):
+        """
+        Render every other static screen in the background.
+
+        Only done while a static screen is up: the device is idle then, and
+        the setup ladder usually moves on to another static screen next,
+        which can then be shown without rendering. While playing content
+        the CPU is left to MPV.
+        """
+        for mode in STATIC_SCREENS:
+            self._queue_screen_render(mode, device_uuid)
+
+    def _show_static_screen(self, mode: DisplayMode, device_uuid: Optional[str],
+                            fallback_message: str) -> Optional[subprocess.Popen]:
+        """
+        Show a static screen with feh, rendering it only if its inputs changed.
+
+        Rendering (gradient, fonts, QR code) is the expensive part, and the
+        result depends only on the screen size and device UUID, so an image
+        already rendered for the same inputs is shown again as-is.
+
+        Args:
+            mode: Static display mode (a key of STATIC_SCREENS)
+            device_uuid: Device UUID shown on the screen
+            fallback_message: Text for the ImageMagick fallback if PIL fails
+
+        Returns:
+            The feh process handle, or None if it couldn't be started.
+        """
+        img_name = STATIC_SCREENS[mode][0]
+        inputs = self._screen_inputs(device_uuid)
+
+        future = self._queue_screen_render(mode, device_uuid)
+        if future is None:
+            logger.debug(f"Reusing rendered {img_name}")
+        else:
+            self._wait_for_screen_render(img_name, future)
+
+        if self._is_rendered(img_name, inputs):
+            return launch_feh(display_image_path(img_name))
+
+        process = display_image_with_feh(None, img_name, fallback_message=fallback_message)
+        # ImageMagick fallback output isn't worth keeping. Forget the file
+        # only after writing it, in case a render that timed out landed
+        # in the meantime and was then overwritten.
+        self._rendered_screens.pop(img_name, None)
+        return process
+
     def transition_to_mode(self, new_mode: DisplayMode):
         """Transition to a new display mode."""
         if new_mode == self.current_mode:
@@ -1684,6 +2323,13 @@ class JamPlayerDisplayManager:
         old_mode = self.current_mode
         logger.info(f"Transitioning from {old_mode} to {new_mode}")
 
+        device_uuid = get_device_uuid()
+        if new_mode in STATIC_SCREENS:
+            self._start_static_screen_render(new_mode, device_uuid)
+        else:
+            # Leave the CPU to MPV
+            self._cancel_screen_renders()
+
         # Clean up old mode
         if old_mode == DisplayMode.PLAYING_CONTENT:
             if self.mpv:
@@ -1702,15 +2348,11 @@ class JamPlayerDisplayManager:
 
         # Enter new mode
         self.current_mode = new_mode
-        device_uuid = get_device_uuid()
 
         if new_mode == DisplayMode.AWAITING_NETWORK:
             logger.info("Showing AWAITING_NETWORK screen (setup/QR code)")
-            img = create_unregistered_screen(
-                self.screen_width, self.screen_height, device_uuid
-            )
-            self.feh_process = display_image_with_feh(
-                img, "jam_display_awaiting_network",
+            self.feh_process = self._show_static_screen(
+                new_mode, device_uuid,
                 fallback_message="JAM Player\n\nSet up with JAM Player Setup App\nScan QR code to begin"
             )
             if self.feh_process:
@@ -1721,11 +2363,8 @@ class JamPlayerDisplayManager:
 
         elif new_mode == DisplayMode.AWAITING_REGISTRATION:
             logger.info("Showing AWAITING_REGISTRATION screen")
-            img = create_awaiting_registration_screen(
-                self.screen_width, self.screen_height, device_uuid
-            )
-            self.feh_process = display_image_with_feh(
-                img, "jam_display_awaiting_registration",
+            self.feh_process = self._show_static_screen(
+                new_mode, device_uuid,
                 fallback_message=(
                     "Almost there.\n\n"
                     "Your JAM Player is connected to the internet.\n\n"
@@ -1742,11 +2381,8 @@ class JamPlayerDisplayManager:
 
         elif new_mode == DisplayMode.AWAITING_SCREEN_LINK:
             logger.info("Showing AWAITING_SCREEN_LINK screen")
-            img = create_awaiting_screen_link_screen(
-                self.screen_width, self.screen_height, device_uuid
-            )
-            self.feh_process = display_image_with_feh(
-                img, "jam_display_awaiting_screen_link",
+            self.feh_process = self._show_static_screen(
+                new_mode, device_uuid,
                 fallback_message=(
                     "Registered!\n\n"
                     "Almost there.\n\n"
@@ -1763,11 +2399,8 @@ class JamPlayerDisplayManager:
 
         elif new_mode == DisplayMode.DOWNLOADING_CONTENT:
             logger.info("Showing DOWNLOADING_CONTENT screen")
-            img = create_waiting_for_content_screen(
-                self.screen_width, self.screen_height, device_uuid
-            )
-            self.feh_process = display_image_with_feh(
-                img, "jam_display_downloading",
+            self.feh_process = self._show_static_screen(
+                new_mode, device_uuid,
                 fallback_message="Waiting for content...\n\nContent is being downloaded.\nThis may take a few minutes."
             )
             if self.feh_process:
@@ -1778,11 +2411,8 @@ class JamPlayerDisplayManager:
 
         elif new_mode == DisplayMode.NO_ACTIVE_SCENES:
             logger.info("Showing NO_ACTIVE_SCENES screen")
-            img = create_no_active_scenes_screen(
-                self.screen_width, self.screen_height, device_uuid
-            )
-            self.feh_process = display_image_with_feh(
-                img, "jam_display_no_active_scenes",
+            self.feh_process = self._show_static_screen(
+                new_mode, device_uuid,
                 fallback_message=(
                     "No active scenes\n\n"
                     "This screen has no active scenes.\n"
@@ -1800,6 +2430,9 @@ class JamPlayerDisplayManager:
             self._start_video_playback()
             sd_notifier.notify("STATUS=Playing content")
 
+        if new_mode in STATIC_SCREENS:
+            self._prerender_static_screens(device_uuid)
+
     def _start_video_playback(self):
         """Initialize and start video playback."""
         # Kill any feh processes first
@@ -1817,7 +2450,7 @@ class JamPlayerDisplayManager:
             logger.error("No scenes available for playback")
             return
 
-        media_dir = Path(constants.APP_DATA_LIVE_MEDIA_DIR)
+        media_dir = self._media_dir
         first_scene = scenes[0]
         media_file = first_scene.get('media_file')
         if not media_file:
@@ -2005,71 +2638,31 @@ class JamPlayerDisplayManager:
             self.mpv.stop_mpv()
             self.mpv = None
 
-        # Create and show a message with gradient background
-        if HAS_PIL:
-            # Warm mesh gradient for "off hours" theme
-            img = create_mesh_gradient_background(
-                self.screen_width, self.screen_height, theme="warm"
-            )
-            draw = ImageDraw.Draw(img)
-
-            title_font = get_font(FONT_SIZE_TITLE)
-            subtitle_font = get_font(FONT_SIZE_SUBTITLE, bold=False)
-
-            center_x = self.screen_width // 2
-            center_y = self.screen_height // 2
-
-            # Logo at top
-            logo_height = min(80, self.screen_height // 10)
-            logo = load_and_scale_logo(logo_height)
-            if logo:
-                logo_x = center_x - logo.width // 2
-                logo_y = int(self.screen_height * 0.15)
-                img.paste(logo, (logo_x, logo_y), logo if logo.mode == 'RGBA' else None)
-
-            # Title
-            title = "No Content Scheduled"
-            draw.text(
-                (center_x, center_y - 30),
-                title,
-                font=title_font,
-                fill=JAM_ORANGE_PRIMARY,
-                anchor="mm"
-            )
-
-            # Subtitle
-            subtitle = "Content will appear during scheduled hours."
-            draw.text(
-                (center_x, center_y + 40),
-                subtitle,
-                font=subtitle_font,
-                fill=TEXT_COLOR,
-                anchor="mm"
-            )
-
-            # Version indicator
-            version_font = get_font(14, bold=False)
-            draw.text(
-                (self.screen_width - 30, self.screen_height - 25),
-                "v2",
-                font=version_font,
-                fill=(80, 80, 80),
-                anchor="mm"
-            )
-        else:
-            img = None
+        # The screen only depends on the screen size, so an image already
+        # rendered for it is shown again as-is
+        img_name = "jam_display_no_schedule"
+        inputs = (self.screen_width, self.screen_height)
+        if self._is_rendered(img_name, inputs):
+            logger.debug(f"Reusing rendered {img_name}")
+            self.feh_process = launch_feh(display_image_path(img_name))
+            return
 
+        img = create_no_scheduled_content_screen(self.screen_width, self.screen_height)
         self.feh_process = display_image_with_feh(
-            img, "jam_display_no_schedule",
+            img, img_name,
             fallback_message="No Content Scheduled\n\nContent will appear\nduring scheduled hours."
         )
+        if img is None:
+            self._rendered_screens.pop(img_name, None)
+        else:
+            self._rendered_screens[img_name] = inputs
 
     def _run_scene_by_scene_sync(self):
         """
         Play scenes one by one with wall clock sync.
         Supports dynamic scheduling - periodically re-filters scenes by day/time.
         """
-        media_dir = Path(constants.APP_DATA_LIVE_MEDIA_DIR)
+        media_dir = self._media_dir
         scenes = self._load_scenes()
 
         if not scenes:
@@ -2119,14 +2712,13 @@ class JamPlayerDisplayManager:
         while self.running and self.current_mode == DisplayMode.PLAYING_CONTENT:
             current_time_sec = time.time()
 
-            # Check for content updates (file modified)
-            scenes_file = Path(constants.APP_DATA_LIVE_SCENES_DIR) / "scenes.json"
-            try:
-                scenes_mtime = scenes_file.stat().st_mtime if scenes_file.exists() else 0
-            except:
-                scenes_mtime = 0
-
-            content_changed = not hasattr(self, '_last_scenes_mtime') or scenes_mtime != self._last_scenes_mtime
+            # Check for content updates (file modified). While the scenes
+            # directory is watched, scenes.json is only stat()ed after
+            # something in it changed.
+            content_changed = False
+            if not hasattr(self, '_last_scenes_mtime') or self._wait_for_content_change(0):
+                scenes_mtime = self._get_scenes_mtime()
+                content_changed = not hasattr(self, '_last_scenes_mtime') or scenes_mtime != self._last_scenes_mtime
 
             # Periodically re-check schedule even if content hasn't changed
             schedule_check_needed = (current_time_sec - self._last_schedule_check) >= SCHEDULE_CHECK_INTERVAL_SEC
@@ -2185,7 +2777,7 @@ class JamPlayerDisplayManager:
                     return  # Exit to main loop to re-check mode
 
                 # Wait and re-check for scheduled scenes
-                sd_notifier.notify("WATCHDOG=1")
+                self._watchdog.ping_if_due()
                 time.sleep(5)
                 new_scenes = self._load_scenes()
                 if new_scenes:
@@ -2212,7 +2804,7 @@ class JamPlayerDisplayManager:
                 logger.warning("MPV process died, restarting...")
 
                 # Track this crash for self-healing detection
-                current_time = time.time()
+                current_time = time.monotonic()
                 self._mpv_crash_times.append(current_time)
 
                 # Remove old crash times outside the window
@@ -2256,14 +2848,14 @@ class JamPlayerDisplayManager:
             position_in_cycle_ms = self._calculate_expected_position(cycle_duration_ms)
             scene_index, position_in_scene_ms, scene = self._get_scene_at_position(scenes, position_in_cycle_ms)
 
-            media_file = scene.get('media_file')
-            media_type = scene.get('media_type', 'IMAGE')  # IMAGE or VIDEO
-            scene_duration_ms = int(scene.get('actual_duration', scene.get('duration', 15)) * 1000)
-            media_path = media_dir / media_file
-
-            # Check if we need to switch scenes
+            # Check if we need to switch scenes. Everything about the scene
+            # is looked up only then, not on every tick.
             if scene_index != self._current_scene_index:
-                if not media_path.exists():
+                media_file = scene.get('media_file')
+                media_type = scene.get('media_type', 'IMAGE')  # IMAGE or VIDEO
+                media_path = media_dir / media_file
+
+                if not self._media_file_exists(media_file):
                     logger.error(f"Media file not found: {media_path}")
                     time.sleep(0.5)
                     continue
@@ -2273,111 +2865,82 @@ class JamPlayerDisplayManager:
 
                 # Just load and play - no seeking or sync logic for now
                 self.mpv.load_file(str(media_path))
-                time.sleep(0.1)  # Brief delay for MPV to initialize
 
                 # For single-scene content, ensure looping is enabled
-                # (loadfile replace can reset the loop property)
+                # (loadfile replace can reset the loop property, so only
+                # once the new file has loaded)
                 if len(scenes) == 1:
+                    if not self.mpv.wait_for_file_loaded():
+                        logger.debug("MPV didn't confirm the file loaded, setting loop-file anyway")
                     self.mpv.set_property('loop-file', 'inf')
                     logger.debug("Single scene - enabled loop-file=inf")
 
             # Notify systemd watchdog
-            sd_notifier.notify("WATCHDOG=1")
+            self._watchdog.ping_if_due()
             time.sleep(0.05)
 
-    def _check_content_updated(self) -> bool:
-        """Check if scenes.json has been updated since we last loaded it."""
-        scenes_file = Path(constants.APP_DATA_LIVE_SCENES_DIR) / "scenes.json"
-        if not scenes_file.exists():
-            return False
-        current_mtime = scenes_file.stat().st_mtime
-        return hasattr(self, '_last_scenes_mtime') and current_mtime != self._last_scenes_mtime
-
-    def _wait_for_video_end(self) -> bool:
-        """Wait for the current video to finish. Returns False if interrupted."""
-        # Get video duration
-        duration = None
-        for _ in range(30):
-            if not self.running or self.current_mode != DisplayMode.PLAYING_CONTENT:
-                return False
-            duration = self.mpv.get_duration()
-            if duration is not None and duration > 0:
-                break
-            time.sleep(0.5)
-
-        if duration is None:
-            logger.warning("Could not get video duration, using 30s fallback")
-            duration = 30
+    def _get_content_watcher(self) -> DirectoryWatcher:
+        """Get the inotify watcher for the scenes and media directories."""
+        if self._content_watcher is None:
+            self._content_watcher = DirectoryWatcher([self._scenes_file.parent, self._media_dir])
+            self._media_files = None
+        return self._content_watcher
 
-        logger.debug(f"Video duration: {duration:.1f}s")
-
-        start_time = time.time()
-        last_content_check = start_time
-        while self.running and self.current_mode == DisplayMode.PLAYING_CONTENT:
-            current_time = time.time()
-
-            # Check for state changes
-            if current_time - start_time > 5:
-                new_mode = self.determine_display_mode()
-                if new_mode != self.current_mode:
-                    return False
-
-            # Check for content updates every second
-            if current_time - last_content_check >= 1:
-                last_content_check = current_time
-                if self._check_content_updated():
-                    logger.info("Content updated during video playback, interrupting")
-                    return False
-
-            # Check if video ended
-            eof = self.mpv.get_property('eof-reached')
-            if eof:
-                logger.info("Video playback complete")
-                return True
-
-            # Safety timeout
-            if current_time - start_time > duration + 5:
-                logger.warning("Video timeout, moving to next scene")
-                return True
+    def _wait_for_content_change(self, timeout: float) -> bool:
+        """
+        Wait for a change in the scenes or media directory.
 
-            sd_notifier.notify("WATCHDOG=1")
-            time.sleep(0.1)
+        Args:
+            timeout: Maximum time to wait in seconds
 
+        Returns:
+            True if something changed (always True while a directory isn't
+            watched, so callers fall back to checking every time).
+        """
+        watcher = self._get_content_watcher()
+        changed = watcher.wait(timeout)
+        if changed or not watcher.has_all_watches:
+            self._media_files = None
+            return True
         return False
 
-    def _wait_for_duration(self, duration_seconds: int) -> bool:
-        """Wait for the specified duration. Returns False if interrupted."""
-        logger.debug(f"Displaying image for {duration_seconds}s")
-
-        start_time = time.time()
-        last_state_check = start_time
-        last_content_check = start_time
-
-        while self.running and self.current_mode == DisplayMode.PLAYING_CONTENT:
-            current_time = time.time()
-            elapsed = current_time - start_time
-
-            if elapsed >= duration_seconds:
-                return True
+    def _list_media_dir(self) -> set:
+        """
+        Get the names in the media directory from a single listing.
 
-            # Check for state changes periodically
-            if current_time - last_state_check >= 5:
-                last_state_check = current_time
-                new_mode = self.determine_display_mode()
-                if new_mode != self.current_mode:
-                    return False
+        Raises:
+            OSError: If the directory can't be listed (FileNotFoundError if
+                     it doesn't exist yet).
+        """
+        with os.scandir(self._media_dir) as entries:
+            return {entry.name for entry in entries}
 
-            # Check for content updates every second
-            if current_time - last_content_check >= 1:
-                last_content_check = current_time
-                if self._check_content_updated():
-                    logger.info("Content updated during image display, interrupting")
-                    return False
+    def _media_file_exists(self, media_file: str) -> bool:
+        """
+        Check whether a media file is on disk.
 
-            sd_notifier.notify("WATCHDOG=1")
-            time.sleep(0.1)
+        Answered from one directory listing, which is refreshed whenever
+        the content watcher sees the media directory change; without the
+        watcher every check is a stat().
+        """
+        media_dir = self._media_dir
+        if not self._get_content_watcher().has_all_watches:
+            return (media_dir / media_file).exists()
 
-        return False
+        if self._media_files is None:
+            try:
+                self._media_files = self._list_media_dir()
+            except OSError as e:
+                logger.warning(f"Cannot list media directory: {e}")
+                return (media_dir / media_file).exists()
+        return media_file in self._media_files
+
+    def _get_scenes_mtime(self) -> float:
+        """Get the mtime of scenes.json, or 0 if it is missing or unreadable."""
+        try:
+            return self._scenes_file.stat().st_mtime
+        except OSError:
+            return 0
 
     def run(self):
         """Main run loop - monitors state and manages display modes."""
@@ -2394,15 +2957,23 @@ class JamPlayerDisplayManager:
         sd_notifier.notify("READY=1")
         logger.info("Service ready, entering main loop")
 
-        last_state_check = 0
+        # Monotonic deadline of the next full state check (0 = check now)
+        next_state_check = 0
+
+        state_watcher = self._state_watcher
+        logger.info(f"Watching {len(state_watcher.watched)} state directories")
 
         try:
             while self.running:
-                current_time = time.time()
+                current_time = time.monotonic()
 
                 # Check state periodically (or if mode is None)
-                if self.current_mode is None or current_time - last_state_check >= STATE_CHECK_INTERVAL_SEC:
-                    last_state_check = current_time
+                if self.current_mode is None or current_time >= next_state_check:
+                    if state_watcher.has_all_watches:
+                        next_state_check = current_time + STATE_CHECK_WATCHED_INTERVAL_SEC
+                    else:
+                        # Some directory isn't watched (yet) - keep polling so we can't miss it
+                        next_state_check = current_time + STATE_CHECK_INTERVAL_SEC
                     new_mode = self.determine_display_mode()
 
                     if new_mode != self.current_mode:
@@ -2412,21 +2983,42 @@ class JamPlayerDisplayManager:
                 if self.current_mode == DisplayMode.PLAYING_CONTENT:
                     self.run_video_loop()
                     # After video loop exits, recheck state
+                    next_state_check = 0
                     continue
 
                 # For static display modes, check feh is still running and sleep
                 if self.feh_process:
                     poll_result = self.feh_process.poll()
                     if poll_result is not None:
+                        restart_wait = self._last_feh_restart + FEH_RESTART_MIN_INTERVAL_SEC - current_time
+                        if restart_wait > 0:
+                            # feh died again right after a restart - hold off
+                            # so a failing feh isn't relaunched in a tight loop
+                            self._watchdog.ping_if_due()
+                            if self._wait_for_state_change(restart_wait):
+                                next_state_check = 0
+                            continue
                         # feh has exited - this shouldn't happen
                         logger.warning(f"feh process exited with code {poll_result}, restarting display")
+                        self._last_feh_restart = current_time
                         # Force re-transition to current mode to restart feh
                         old_mode = self.current_mode
                         self.current_mode = None
                         self.transition_to_mode(old_mode)
 
-                sd_notifier.notify("WATCHDOG=1")
-                time.sleep(1)
+                self._watchdog.ping_if_due()
+
+                # Sleep until a state directory changes or feh exits. Without
+                # a pidfd to wake on, feh has to be polled every second.
+                feh_exit_fd = self._feh_exit_fd()
+                if feh_exit_fd is not None or self.feh_process is None:
+                    wait_sec = STATE_CHECK_INTERVAL_SEC
+                else:
+                    wait_sec = 1
+                wake_fds = (feh_exit_fd,) if feh_exit_fd is not None else ()
+                if self._wait_for_state_change(wait_sec, wake_fds):
+                    # Something changed in a state directory - re-check now
+                    next_state_check = 0
 
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
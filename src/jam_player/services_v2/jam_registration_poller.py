@@ -28,7 +28,7 @@ from common.credentials import (
     set_device_announced,
     set_device_registered,
 )
-from common.api import get_api_base_url, api_request
+from common.api import get_api_base_url, api_request, response_body_preview
 from common.paths import REGISTERED_FLAG
 from common.system import manage_service
 
@@ -74,7 +74,7 @@ def check_registration_status(device_uuid: str) -> Optional[str]:
         logger.warning("Device not found in backend - may not be announced yet")
         return None
     else:
-        logger.error(f"API returned status {response.status_code}: {response.text}")
+        logger.error(f"API returned status {response.status_code}: {response_body_preview(response)}")
         return None
 
 
@@ -41,7 +41,14 @@ from common.credentials import (
     get_ssh_private_key,
     get_jp_image_id,
 )
-from common.api import api_request, get_api_base_url, report_error, ErrorSeverity, SystemService
+from common.api import (
+    api_request,
+    get_api_base_url,
+    report_error,
+    response_body_preview,
+    ErrorSeverity,
+    SystemService,
+)
 
 logger = setup_service_logging('jam-tailscale')
 
@@ -231,7 +238,7 @@ def try_announce() -> bool:
         set_device_announced()
         return True
     else:
-        logger.warning(f"Announce API returned {response.status_code}: {response.text}")
+        logger.warning(f"Announce API returned {response.status_code}: {response_body_preview(response)}")
         return False
 
 
@@ -291,11 +298,11 @@ def fetch_tailscale_credentials() -> Optional[Tuple[str, str]]:
         return None
 
     if response.status_code == 401:
-        logger.error(f"Authentication failed (401) - device may not be announced or signature invalid. Response: {response.text}")
+        logger.error(f"Authentication failed (401) - device may not be announced or signature invalid. Response: {response_body_preview(response)}")
         return None
 
     if response.status_code != 200:
-        logger.error(f"Backend returned status {response.status_code}: {response.text}")
+        logger.error(f"Backend returned status {response.status_code}: {response_body_preview(response)}")
         return None
 
     try:
@@ -310,7 +317,7 @@ def fetch_tailscale_credentials() -> Optional[Tuple[str, str]]:
             logger.error(f"Invalid credentials response - missing clientId or clientSecret. Response: {data}")
             return None
     except Exception as e:
-        logger.error(f"Error parsing credentials response: {e}. Raw response: {response.text}")
+        logger.error(f"Error parsing credentials response: {e}. Raw response: {response_body_preview(response)}")
         return None
 
 
@@ -344,7 +351,7 @@ def get_oauth_access_token(client_id: str, client_secret: str) -> Optional[str]:
             data = response.json()
             return data.get('access_token')
         else:
-            logger.error(f"Tailscale OAuth failed: {response.status_code} {response.text}")
+            logger.error(f"Tailscale OAuth failed: {response.status_code} {response_body_preview(response)}")
             return None
     except Exception as e:
         logger.error(f"Error getting OAuth token: {e}")
@@ -391,7 +398,7 @@ def generate_auth_key(access_token: str) -> Optional[str]:
             data = response.json()
             return data.get('key')
         else:
-            logger.error(f"Failed to generate auth key: {response.status_code} {response.text}")
+            logger.error(f"Failed to generate auth key: {response.status_code} {response_body_preview(response)}")
             return None
     except Exception as e:
         logger.error(f"Error generating auth key: {e}")
@@ -490,7 +497,7 @@ def report_tailscale_ip_to_backend(ip: str) -> bool:
         logger.info("Tailscale IP reported to backend successfully")
         return True
     else:
-        logger.warning(f"Failed to report Tailscale IP: {response.status_code} {response.text}")
+        logger.warning(f"Failed to report Tailscale IP: {response.status_code} {response_body_preview(response)}")
         return False
 
 